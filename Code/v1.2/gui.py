@@ -6,24 +6,28 @@ from dateutil.relativedelta import relativedelta
 from decimal import Decimal, InvalidOperation
 import locale
 import os
+import re
 
 # Import the core calculation function from the logic file
-from logic import calculate_amortization_schedule
+from logic import COLUMNS, calculate_amortization_schedule
+
+# Matches both supported formats: 'YYYY-MM-DD' and 'YYYYMMDD'.
+# The separator is captured once and reused, so mixed forms like '2024-0101' don't match.
+_DATE_RE = re.compile(r'\s*(\d{4})(-?)(\d{2})\2(\d{2})\s*')
+# The canonical 'YYYY-MM-DD' form that _format_date_entry produces
+_CANON_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
 
 def parse_flexible_date(date_string: str) -> datetime:
     """
     Parses a date string from one of the supported formats ('%Y-%m-%d' or '%Y%m%d').
     Raises ValueError if the string cannot be parsed with any of the formats.
     """
-    # Clean whitespace from the input string
-    date_string = date_string.strip()
-    
-    formats_to_try = ["%Y-%m-%d", "%Y%m%d"]
-    for fmt in formats_to_try:
+    match = _DATE_RE.fullmatch(date_string)
+    if match:
         try:
-            return datetime.strptime(date_string, fmt)
+            return datetime(int(match[1]), int(match[3]), int(match[4]))
         except ValueError:
-            continue
+            pass  # Out-of-range month or day
     # If all formats failed, raise an error with clear instructions
     raise ValueError("Format tanggal tidak valid. Gunakan 'YYYY-MM-DD' atau 'YYYYMMDD'.")
 
@@ -66,7 +70,8 @@ class AmortizationApp(tk.Tk):
         total_cost_entry = ttk.Entry(input_frame, textvariable=self.total_cost_var, width=40)
         total_cost_entry.grid(row=1, column=1, padx=5, pady=5)
         self.total_cost_entry = total_cost_entry  # Save reference for cursor management
-        self.total_cost_trace_id = self.total_cost_var.trace_add('write', self._format_total_cost)
+        self._formatting_total_cost = False  # Guard against recursion from our own writes
+        self.total_cost_var.trace_add('write', self._format_total_cost)
 
         # Start Date Entry
         self.start_date_var = tk.StringVar(value=datetime.now().strftime('%Y-%m-01'))
@@ -116,8 +121,11 @@ class AmortizationApp(tk.Tk):
 
     def _format_date_entry(self, date_var: tk.StringVar):
         """Formats the date in a StringVar to YYYY-MM-DD on focus out."""
+        date_str = date_var.get()
+        # Already in canonical form; skip the parse and the StringVar write
+        if _CANON_RE.fullmatch(date_str):
+            return
         try:
-            date_str = date_var.get()
             if date_str:  # only format if not empty
                 parsed_date = parse_flexible_date(date_str)
                 date_var.set(parsed_date.strftime('%Y-%m-%d'))
@@ -128,8 +136,10 @@ class AmortizationApp(tk.Tk):
 
     def _format_total_cost(self, *args):
         """Formats the total cost entry with thousand separators as the user types."""
-        # Temporarily remove the trace to avoid recursion
-        self.total_cost_var.trace_remove('write', self.total_cost_trace_id)
+        # Ignore the write triggered by setting the formatted value below
+        if self._formatting_total_cost:
+            return
+        self._formatting_total_cost = True
 
         try:
             current_val = self.total_cost_var.get()
@@ -142,7 +152,7 @@ class AmortizationApp(tk.Tk):
             if cleaned_val:
                 num_val = int(cleaned_val)
                 # Format with locale-specific grouping (e.g., '1.000.000')
-                formatted_val = locale.format_string("%d", num_val, grouping=True)
+                formatted_val = f"{num_val:,d}".replace(',', self._thou)
                 
                 self.total_cost_var.set(formatted_val)
                 
@@ -156,8 +166,7 @@ class AmortizationApp(tk.Tk):
                  self.total_cost_var.set("")
 
         finally:
-            # Always re-add the trace
-            self.total_cost_trace_id = self.total_cost_var.trace_add('write', self._format_total_cost)
+            self._formatting_total_cost = False
 
 
 
@@ -165,10 +174,17 @@ class AmortizationApp(tk.Tk):
         """Sets up locale for currency formatting with a fallback."""
         try:
             locale.setlocale(locale.LC_ALL, 'id_ID')
-            self.format_currency = lambda val: locale.format_string('%.2f', val, grouping=True)
+            # Read the separators once; formatting then only needs a single translate pass
+            conv = locale.localeconv()
+            thou = conv['thousands_sep']
+            dec = conv['decimal_point']
         except locale.Error:
             # Fallback if 'id_ID' locale is not installed on the system
-            self.format_currency = lambda val: f"{val:,.2f}".replace(',', '#').replace('.', ',').replace('#', '.')
+            thou, dec = '.', ','
+
+        self._thou = thou or '.'
+        table = str.maketrans({',': thou, '.': dec})
+        self.format_currency = lambda val: f"{val:,.2f}".translate(table)
 
     def run_calculation(self):
         self.tree.delete(*self.tree.get_children())
@@ -200,41 +216,46 @@ class AmortizationApp(tk.Tk):
             messagebox.showerror("Error Input", str(e))
             return
         
-        schedule_df, error_msg = calculate_amortization_schedule(total_cost, start_date, end_date)
+        schedule_rows, error_msg = calculate_amortization_schedule(total_cost, start_date, end_date)
 
         if error_msg:
             messagebox.showerror("Error Perhitungan", error_msg)
             return
 
         # Populate the treeview with formatted data
-        for index, row in schedule_df.iterrows():
-            formatted_values = [
-                row['Periode'],
-                row['Tanggal'].strftime('%Y-%m-%d'),
-                row['Deskripsi'],
-                self.format_currency(row['Beban Amortisasi']),
-                self.format_currency(row['Akumulasi Amortisasi']),
-                self.format_currency(row['Nilai Buku'])
-            ]
-            self.tree.insert("", "end", values=formatted_values)
+        format_currency = self.format_currency
+        for row in schedule_rows:
+            self.tree.insert("", "end", values=(
+                row.period,
+                row.date_str,
+                row.desc,
+                format_currency(row.amort),
+                format_currency(row.acc),
+                format_currency(row.book)
+            ))
         
-        self.save_to_excel(schedule_df, asset_name)
+        self.save_to_excel(schedule_rows, asset_name)
 
-    def save_to_excel(self, df: pd.DataFrame, asset_name: str):
+    def save_to_excel(self, schedule_rows: list, asset_name: str):
         output_filename = f'Hasil Amortisasi {asset_name}.xlsx'
         try:
-            # Create a new DataFrame for excel export
-            df_for_export = df.copy()
-
-            # Convert numbers to localized strings for Excel output.
-            # This stores them as TEXT, making them unusable for formulas in Excel.
-            for col in ['Beban Amortisasi', 'Akumulasi Amortisasi', 'Nilai Buku']:
-                df_for_export[col] = df_for_export[col].apply(self.format_currency)
-            
-            df_for_export['Tanggal'] = df_for_export['Tanggal'].dt.strftime('%Y-%m-%d')
-
-            with pd.ExcelWriter(output_filename, engine='openpyxl') as writer:
+            # The DataFrame is only needed for the export, so build it here
+            df = pd.DataFrame.from_records(schedule_rows, columns=COLUMNS + ['Tanggal_str'])
+
+            # Export the numbers as real numeric cells (usable in Excel formulas)
+            # and let Excel handle the display through a number format.
+            money_cols = ['Beban Amortisasi', 'Akumulasi Amortisasi', 'Nilai Buku']
+            df_for_export = df.drop(columns='Tanggal_str').assign(
+                Tanggal=df['Tanggal_str'],
+                **{col: df[col].astype('float64') for col in money_cols}
+            )
+
+            with pd.ExcelWriter(output_filename, engine='xlsxwriter') as writer:
                 df_for_export.to_excel(writer, sheet_name='Jadwal Amortisasi', index=False)
+
+                # Apply the number format once to the money columns (D, E, F)
+                money_fmt = writer.book.add_format({'num_format': '#,##0.00'})
+                writer.sheets['Jadwal Amortisasi'].set_column('D:F', 18, money_fmt)
             
             self.status_var.set(f"Sukses! Jadwal disimpan ke '{output_filename}'")
             messagebox.showinfo("Sukses", f"Jadwal amortisasi telah disimpan ke file:\n{output_filename}")
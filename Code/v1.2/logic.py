@@ -1,66 +1,78 @@
-import pandas as pd
+import numpy as np
+from collections import namedtuple
+from calendar import monthrange
 from datetime import datetime
-from dateutil.relativedelta import relativedelta
 from decimal import Decimal, getcontext
 
 # Set precision for Decimal calculations
 getcontext().prec = 28
 
+COLUMNS = [
+    'Periode', 'Tanggal', 'Deskripsi',
+    'Beban Amortisasi', 'Akumulasi Amortisasi', 'Nilai Buku'
+]
+
+# Satu baris jadwal; urutan field sama dengan COLUMNS, ditambah tanggal
+# yang sudah diformat 'YYYY-MM-DD' untuk tampilan dan ekspor
+ScheduleRow = namedtuple('ScheduleRow', 'period date desc amort acc book date_str')
+
 def calculate_amortization_schedule(total_cost: Decimal, start_date: datetime, end_date: datetime):
     """
     Menghitung jadwal amortisasi menggunakan tipe data Decimal untuk akurasi finansial.
-    Mengembalikan DataFrame dengan tipe data numerik mentah.
+    Mengembalikan list ScheduleRow dengan tipe data numerik mentah.
     """
     num_months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month) + 1
     
     if num_months <= 0:
         return None, "Periode sewa tidak valid. Tanggal selesai harus setelah tanggal mulai."
         
-    monthly_amortization = (total_cost / Decimal(num_months)).quantize(Decimal("0.01"))
+    total_cents = int((total_cost * 100).to_integral_value())
+    
+    # Hitung amortisasi bulanan dalam satuan sen; bulan terakhir menyerap sisa pembulatan
+    amort = np.full(num_months, total_cents // num_months, dtype=np.int64)
+    amort[-1] += total_cents - amort.sum()
+    accumulated = np.cumsum(amort)
+    book = total_cents - accumulated
+    
+    # Dikonversi sekali ke list int agar loop tidak mengindeks array NumPy per baris
+    amort = amort.tolist()
+    accumulated = accumulated.tolist()
+    book = book.tolist()
     
     schedule_data = []
-    accumulated_amortization = Decimal("0.00")
-    book_value = total_cost
     
     # Baris awal (Periode 0)
-    schedule_data.append([
+    schedule_data.append(ScheduleRow(
         0,
         start_date,
         'Initial Value',
         Decimal("0.00"),
         Decimal("0.00"),
-        book_value
-    ])
+        total_cost,
+        f"{start_date.year:04d}-{start_date.month:02d}-{start_date.day:02d}"
+    ))
     
-    # Membuat jadwal untuk setiap bulan
+    # Membuat jadwal untuk setiap bulan; tahun dan bulan dihitung dengan aritmetika
+    # bilangan bulat, bukan relativedelta per baris
+    year, month, start_day = start_date.year, start_date.month, start_date.day
     for i in range(1, num_months + 1):
-        current_date = start_date + relativedelta(months=i-1)
+        # Menangani hari di akhir bulan (misal: 31 Jan -> 28/29 Feb), sama seperti relativedelta
+        day = min(start_day, monthrange(year, month)[1])
+        current_date = start_date.replace(year=year, month=month, day=day)
         
-        # Memastikan nilai buku adalah nol pada akhir periode
-        if i == num_months:
-            # Sisa amortisasi untuk bulan terakhir untuk memastikan nilai buku menjadi 0
-            amortization_this_month = total_cost - accumulated_amortization
-            accumulated_amortization = total_cost
-            book_value = Decimal("0.00")
-        else:
-            amortization_this_month = monthly_amortization
-            accumulated_amortization += monthly_amortization
-            book_value -= monthly_amortization
-            
-        schedule_data.append([
+        schedule_data.append(ScheduleRow(
             i,
             current_date,
             'Amortization',
-            amortization_this_month,
-            accumulated_amortization,
-            book_value
-        ])
+            Decimal(amort[i-1]).scaleb(-2),
+            Decimal(accumulated[i-1]).scaleb(-2),
+            Decimal(book[i-1]).scaleb(-2),
+            f"{year:04d}-{month:02d}-{day:02d}"
+        ))
         
-    columns = [
-        'Periode', 'Tanggal', 'Deskripsi',
-        'Beban Amortisasi', 'Akumulasi Amortisasi', 'Nilai Buku'
-    ]
-    
-    schedule_df = pd.DataFrame(schedule_data, columns=columns)
+        month += 1
+        if month == 13:
+            month = 1
+            year += 1
     
-    return schedule_df, None
+    return schedule_data, None
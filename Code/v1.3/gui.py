@@ -1,33 +1,64 @@
 import tkinter as tk
 from tkinter import messagebox
 import ttkbootstrap as ttk
-import pandas as pd
-from datetime import datetime
-from dateutil.relativedelta import relativedelta
-from decimal import Decimal, InvalidOperation
+from datetime import datetime, timedelta
+from decimal import Decimal
+from calendar import monthrange
+from functools import lru_cache
 import locale
 import os
+import re
 
-# Import the core calculation function from the logic file
-from logic import calculate_amortization_schedule
+# Number of rows inserted into the treeview per event-loop pass
+INSERT_CHUNK_SIZE = 200
 
-def parse_flexible_date(date_string: str) -> datetime:
+# Matches the supported date formats: 'YYYY-MM-DD' or 'YYYYMMDD'
+# 'YYYY-MM-DD' (month and day may be unpadded, as strptime allowed) or 'YYYYMMDD'
+_DATE_RE = re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})$|^(\d{4})(\d{2})(\d{2})$')
+_DATE_ERROR = "Format tanggal tidak valid. Gunakan 'YYYY-MM-DD' atau 'YYYYMMDD'."
+# A plain decimal number once the thousands separators have been stripped
+_COST_RE = re.compile(r'^\d+(\.\d+)?$')
+
+def default_end_date() -> str:
+    """
+    Returns the default end date: one year from today minus one day, as 'YYYY-MM-DD'.
+    """
+    today = datetime.now()
+    try:
+        next_year = today.replace(year=today.year + 1)
+    except ValueError:
+        # 29 February in a non-leap year falls back to the 28th
+        next_year = today.replace(year=today.year + 1, day=28)
+    return (next_year - timedelta(days=1)).strftime('%Y-%m-%d')
+
+def _try_parse_date(date_string: str) -> tuple:
     """
     Parses a date string from one of the supported formats ('%Y-%m-%d' or '%Y%m%d').
-    Raises ValueError if the string cannot be parsed with any of the formats.
+    Returns (ok, datetime, error_message) instead of raising, since this runs on every focus-out.
     """
-    # Clean whitespace from the input string
-    date_string = date_string.strip()
-    
-    formats_to_try = ["%Y-%m-%d", "%Y%m%d"]
-    for fmt in formats_to_try:
-        try:
-            return datetime.strptime(date_string, fmt)
-        except ValueError:
-            continue
-    # If all formats failed, raise an error with clear instructions
-    raise ValueError("Format tanggal tidak valid. Gunakan 'YYYY-MM-DD' atau 'YYYYMMDD'.")
-
+    match = _DATE_RE.match(date_string.strip())
+    if match:
+        groups = match.groups()
+        year, month, day = map(int, groups[:3] if groups[0] else groups[3:])
+        # Check the ranges up front so datetime() never has to raise
+        if year >= 1 and 1 <= month <= 12 and 1 <= day <= monthrange(year, month)[1]:
+            return True, datetime(year, month, day), None
+    return False, None, _DATE_ERROR
+
+def _try_parse_cost(cost_string: str) -> tuple:
+    """
+    Parses a locale-formatted total cost (e.g. '10.000,50') into a positive Decimal.
+    Returns (ok, Decimal, error_message) instead of raising.
+    """
+    cleaned = cost_string.replace('.', '').replace(',', '.')
+    if not cleaned:
+        return False, None, "Harga perolehan tidak boleh kosong."
+    if not _COST_RE.match(cleaned):
+        return False, None, "Harga perolehan tidak valid. Harap masukkan angka yang benar (misal: 10.000,50)."
+    total_cost = Decimal(cleaned)
+    if total_cost <= 0:
+        return False, None, "Harga perolehan harus lebih besar dari nol."
+    return True, total_cost, None
 
 class AmortizationApp(ttk.Window):
     def __init__(self, themename="litera"):
@@ -58,8 +89,10 @@ class AmortizationApp(ttk.Window):
         self.total_cost_var = tk.StringVar()
         self.method_var = tk.StringVar(value='Straight-Line')
         self.start_date_var = tk.StringVar(value=datetime.now().strftime('%Y-%m-01'))
-        self.end_date_var = tk.StringVar(value=(datetime.now() + relativedelta(years=1, days=-1)).strftime('%Y-%m-%d'))
+        self.end_date_var = tk.StringVar(value=default_end_date())
         self.schedule_df = None # To store the dataframe
+        self._insert_job = None # Pending after_idle job while the tree is being filled
+        self._formatting_total_cost = False # Re-entry guard for the total cost trace
 
         self._create_input_widgets(input_frame)
         self._create_action_buttons(main_frame)
@@ -75,21 +108,24 @@ class AmortizationApp(ttk.Window):
 
     def _format_date_entry(self, date_var: tk.StringVar):
         """Formats the date in a StringVar to YYYY-MM-DD on focus out."""
-        try:
-            date_str = date_var.get()
-            if date_str:  # only format if not empty
-                parsed_date = parse_flexible_date(date_str)
-                date_var.set(parsed_date.strftime('%Y-%m-%d'))
-        except ValueError as e:
+        date_str = date_var.get()
+        if not date_str:  # only format if not empty
+            return
+        ok, parsed_date, error_msg = _try_parse_date(date_str)
+        if ok:
+            date_var.set(parsed_date.strftime('%Y-%m-%d'))
+        else:
             # If parsing fails, show an error immediately for better UX.
             # Clear the invalid entry to force user correction.
-            messagebox.showerror("Format Tanggal Salah", str(e))
+            messagebox.showerror("Format Tanggal Salah", error_msg)
             date_var.set("")
 
     def _format_total_cost(self, *args):
         """Formats the total cost entry with thousand separators as the user types."""
-        # Temporarily remove the trace to avoid recursion
-        self.total_cost_var.trace_remove('write', self.total_cost_trace_id)
+        # Ignore the write triggered by our own set() below to avoid recursion
+        if self._formatting_total_cost:
+            return
+        self._formatting_total_cost = True
 
         try:
             current_val = self.total_cost_var.get()
@@ -106,7 +142,8 @@ class AmortizationApp(ttk.Window):
             else: # If no digits are left, the field should be empty
                 formatted_val = ""
             
-            self.total_cost_var.set(formatted_val)
+            if formatted_val != current_val:
+                self.total_cost_var.set(formatted_val)
             
             # Adjust cursor position based on the change in length
             len_after = len(formatted_val)
@@ -114,8 +151,7 @@ class AmortizationApp(ttk.Window):
             self.total_cost_entry.icursor(max(0, min(cursor_pos, len_after)))
 
         finally:
-            # Always re-add the trace
-            self.total_cost_trace_id = self.total_cost_var.trace_add('write', self._format_total_cost)
+            self._formatting_total_cost = False
 
 
 
@@ -128,6 +164,10 @@ class AmortizationApp(ttk.Window):
             # Fallback if 'id_ID' locale is not installed on the system
             self.format_currency = lambda val: f"{val:,.2f}".replace(',', '#').replace('.', ',').replace('#', '.')
 
+        # Schedules repeat the same amounts a lot (e.g. the straight-line expense),
+        # so cache the formatted strings keyed on the value.
+        self.format_currency = lru_cache(maxsize=4096)(self.format_currency)
+
     def _create_input_widgets(self, parent_frame):
         """Creates and places all the input widgets in the parent frame."""
         # Grid configuration
@@ -142,7 +182,7 @@ class AmortizationApp(ttk.Window):
         total_cost_entry = ttk.Entry(parent_frame, textvariable=self.total_cost_var, width=40)
         total_cost_entry.grid(row=1, column=1, sticky=tk.EW, padx=5, pady=8)
         self.total_cost_entry = total_cost_entry
-        self.total_cost_trace_id = self.total_cost_var.trace_add('write', self._format_total_cost)
+        self.total_cost_var.trace_add('write', self._format_total_cost)
 
         # Metode Amortisasi
         ttk.Label(parent_frame, text="Amortization Method").grid(row=2, column=0, sticky=tk.W, padx=5, pady=8)
@@ -184,73 +224,87 @@ class AmortizationApp(ttk.Window):
             anchor = tk.E if col not in ['Deskripsi', 'Tanggal'] else tk.W
             self.tree.column(col, anchor=anchor, width=80)
 
-        v_scroll = ttk.Scrollbar(parent_frame, orient="vertical", command=self.tree.yview)
+        self.v_scroll = ttk.Scrollbar(parent_frame, orient="vertical", command=self.tree.yview)
         h_scroll = ttk.Scrollbar(parent_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scroll.set, xscrollcommand=h_scroll.set)
+        self.tree.configure(yscrollcommand=self.v_scroll.set, xscrollcommand=h_scroll.set)
 
         parent_frame.grid_rowconfigure(0, weight=1)
         parent_frame.grid_columnconfigure(0, weight=1)
         self.tree.grid(row=0, column=0, sticky='nsew')
-        v_scroll.grid(row=0, column=1, sticky='ns')
+        self.v_scroll.grid(row=0, column=1, sticky='ns')
         h_scroll.grid(row=1, column=0, sticky='ew')
 
     def _perform_calculation(self):
+        # Stop filling the tree from a previous calculation that is still in progress
+        if self._insert_job is not None:
+            self.after_cancel(self._insert_job)
+            self._insert_job = None
+            self.tree.configure(yscrollcommand=self.v_scroll.set)
         self.tree.delete(*self.tree.get_children())
         self.status_var.set("")
         self.save_button.config(state='disabled')
         self.schedule_df = None
 
-        try:
-            asset_name = self.asset_name_var.get()
-            if not asset_name:
-                raise ValueError("Nama Aset tidak boleh kosong.")
-                
-            total_cost_str = self.total_cost_var.get().replace('.', '').replace(',', '.')
-            if not total_cost_str:
-                raise ValueError("Harga perolehan tidak boleh kosong.")
-
-            total_cost = Decimal(total_cost_str)
-
-            if total_cost <= 0:
-                raise ValueError("Harga perolehan harus lebih besar dari nol.")
-
-            # Use the flexible date parsing function
-            start_date = parse_flexible_date(self.start_date_var.get())
-            end_date = parse_flexible_date(self.end_date_var.get())
-
-            method = self.method_var.get()
-            
-            if end_date <= start_date:
-                raise ValueError("Tanggal selesai harus setelah tanggal mulai.")
-
-        except InvalidOperation:
-            messagebox.showerror("Error Input", "Harga perolehan tidak valid. Harap masukkan angka yang benar (misal: 10.000,50).")
-            return
-        except ValueError as e:
-            # Display the specific error message from parsing or validation
-            messagebox.showerror("Error Input", str(e))
+        # Validate the inputs in order; each check returns (ok, value, error_message)
+        ok, error_msg = bool(self.asset_name_var.get()), "Nama Aset tidak boleh kosong."
+        if ok:
+            ok, total_cost, error_msg = _try_parse_cost(self.total_cost_var.get())
+        if ok:
+            ok, start_date, error_msg = _try_parse_date(self.start_date_var.get())
+        if ok:
+            ok, end_date, error_msg = _try_parse_date(self.end_date_var.get())
+        if ok and end_date <= start_date:
+            ok, error_msg = False, "Tanggal selesai harus setelah tanggal mulai."
+        if not ok:
+            messagebox.showerror("Error Input", error_msg)
             return
+
+        method = self.method_var.get()
         
+        # Import the core calculation function from the logic file.
+        # Deferred until first use so pandas/numpy do not delay the first paint.
+        from logic import calculate_amortization_schedule
+
         self.schedule_df, error_msg = calculate_amortization_schedule(total_cost, start_date, end_date, method)
 
         if error_msg:
             messagebox.showerror("Error Perhitungan", error_msg)
             return
 
-        # Populate the treeview with formatted data
-        for index, row in self.schedule_df.iterrows():
-            formatted_values = [
-                row['Periode'],
-                row['Tanggal'].strftime('%Y-%m-%d'),
-                row['Deskripsi'],
-                self.format_currency(row['Beban Amortisasi']),
-                self.format_currency(row['Akumulasi Amortisasi']),
-                self.format_currency(row['Nilai Buku'])
-            ]
-            self.tree.insert("", "end", values=formatted_values)
-        
-        self.status_var.set("Perhitungan berhasil! Anda sekarang dapat menyimpan ke Excel.")
-        self.save_button.config(state='normal')
+        # Populate the treeview with formatted data.
+        # All values are formatted up front, then inserted in a tight loop.
+        # tolist() hands plain Python ints/floats/strs to the formatter and Tk
+        # instead of boxing a NumPy scalar for every cell.
+        df = self.schedule_df
+        format_currency = self.format_currency
+        rows = list(zip(
+            df['Periode'].tolist(),
+            df['Tanggal'].dt.strftime('%Y-%m-%d').tolist(),
+            df['Deskripsi'].tolist(),
+            map(format_currency, df['Beban Amortisasi'].tolist()),
+            map(format_currency, df['Akumulasi Amortisasi'].tolist()),
+            map(format_currency, df['Nilai Buku'].tolist())
+        ))
+        # Detach the scrollbar while the tree is filled so it is not recomputed on every insert
+        self.tree.configure(yscrollcommand='')
+        self._insert_chunk(rows)
+
+    def _insert_chunk(self, rows, start=0):
+        """Inserts the next chunk of rows, then yields to the event loop so the window can repaint."""
+        end = min(start + INSERT_CHUNK_SIZE, len(rows))
+        insert = self.tree.insert
+        for formatted_values in rows[start:end]:
+            insert("", "end", values=formatted_values)
+
+        if end < len(rows):
+            self._insert_job = self.after_idle(self._insert_chunk, rows, end)
+        else:
+            self._insert_job = None
+            # Reattach the scrollbar and sync it once with the final row count
+            self.tree.configure(yscrollcommand=self.v_scroll.set)
+            self.v_scroll.set(*self.tree.yview())
+            self.status_var.set("Perhitungan berhasil! Anda sekarang dapat menyimpan ke Excel.")
+            self.save_button.config(state='normal')
 
     def _save_to_excel(self):
         if self.schedule_df is None:
@@ -263,15 +317,16 @@ class AmortizationApp(ttk.Window):
         output_filename = f'Hasil Amortisasi {method} - {asset_name}.xlsx'
 
         try:
-            # Create a new DataFrame for excel export
-            df_excel = self.schedule_df.copy()
-            
-            # Convert Decimal to float for Excel compatibility
+            # pandas is already loaded by the calculation; imported here to keep startup light
+            import pandas as pd
+
+            # Convert Decimal to float for Excel compatibility.
+            # assign() only rebuilds these columns; the others are shared, not copied.
+            df = self.schedule_df
             numeric_cols = ['Beban Amortisasi', 'Akumulasi Amortisasi', 'Nilai Buku']
-            for col in numeric_cols:
-                df_excel[col] = df_excel[col].astype(float)
+            df_excel = df.assign(**{col: df[col].astype(float) for col in numeric_cols})
 
-            with pd.ExcelWriter(output_filename, engine='openpyxl') as writer:
+            with pd.ExcelWriter(output_filename, engine='xlsxwriter') as writer:
                 df_excel.to_excel(writer, sheet_name='Jadwal Amortisasi', index=False)
                 
                 # Get the workbook and worksheet objects
@@ -281,12 +336,10 @@ class AmortizationApp(ttk.Window):
                 # Define the number format
                 # Format ini akan menampilkan pemisah ribuan (titik) dan dua desimal (koma)
                 # seperti yang umum di Indonesia.
-                number_format = '#,##0.00'
+                number_format = workbook.add_format({'num_format': '#,##0.00'})
 
-                # Apply the format to the numeric columns (e.g., D, E, F)
-                for col_letter in ['D', 'E', 'F']:
-                    for cell in worksheet[col_letter][1:]: # Skip header
-                        cell.number_format = number_format
+                # Apply the format once to the numeric columns (D, E, F) instead of to every cell
+                worksheet.set_column('D:F', 18, number_format)
             
             self.status_var.set(f"Sukses! Jadwal disimpan ke '{output_filename}'")
             messagebox.showinfo("Sukses", f"Jadwal amortisasi telah disimpan ke file:\n{output_filename}")
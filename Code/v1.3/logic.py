@@ -1,133 +1,193 @@
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from dateutil.relativedelta import relativedelta
 from decimal import Decimal, getcontext
 
 from calendar import monthrange
+from functools import lru_cache
 # Set precision for Decimal calculations
 getcontext().prec = 28
 
-def _calculate_straight_line_schedule(total_cost: Decimal, start_date: datetime, end_date: datetime, num_months: int):
+# Konstanta Decimal yang sering dipakai, dibuat sekali saja
+_ZERO = Decimal("0.00")
+_Q2 = Decimal("0.01")
+
+# Jumlah hari per (tahun, bulan) di-cache; perhitungan berikutnya memakai bulan-bulan yang sama
+_monthrange_cached = lru_cache(maxsize=256)(monthrange)
+
+def _build_period_dates(start_date: datetime, num_months: int):
+    """
+    Menghitung tanggal untuk setiap periode, dengan hari yang sama seperti tanggal mulai.
+    """
+    start_day = start_date.day
+    dates = []
+    # Alias lokal agar tidak mencari nama global/atribut di setiap iterasi
+    _monthrange = _monthrange_cached
+    append = dates.append
+    replace = start_date.replace
+    y, m = start_date.year, start_date.month
+    for _ in range(num_months):
+        # Menangani hari di akhir bulan (misal: 31 Jan -> 28/29 Feb)
+        dim = _monthrange(y, m)[1]
+        append(replace(year=y, month=m, day=min(start_day, dim)))
+        m += 1
+        if m == 13:
+            m = 1
+            y += 1
+    return dates
+
+def _schedule_columns(start_date: datetime, dates, expense, accumulated, book):
+    """
+    Menyusun kolom-kolom jadwal, termasuk baris awal (Periode 0), menjadi dict.
+    """
+    num_months = len(dates)
+    return {
+        'Periode': np.arange(num_months + 1),
+        'Tanggal': [start_date] + dates,
+        'Deskripsi': ['Initial Value'] + ['Amortization'] * num_months,
+        'Beban Amortisasi': expense,
+        'Akumulasi Amortisasi': accumulated,
+        'Nilai Buku': book,
+    }
+
+def _calculate_schedule_float(total_cost: Decimal, start_date: datetime, dates: list, method: str):
+    """
+    Menghitung jadwal amortisasi dalam sen (int64) dan mengembalikannya per kolom
+    sebagai float64. Pembulatan sama dengan versi Decimal (setengah ke genap),
+    sehingga nilainya identik.
+    """
+    num_months = len(dates)
+    # Harga perolehan dalam sen, dibulatkan seperti quantize (ROUND_HALF_EVEN)
+    total_cents = int((total_cost * 100).to_integral_value())
+
+    if method == 'Straight-Line':
+        # Garis lurus berbentuk tertutup: beban konstan, dan bulan terakhir
+        # menyerap sisa pembulatan agar nilai buku menjadi 0
+        monthly_cents = int((total_cost * 100 / num_months).to_integral_value())
+        expense = np.full(num_months + 1, monthly_cents, dtype=np.int64)
+        expense[0] = 0
+        expense[-1] = total_cents - monthly_cents * (num_months - 1)
+        accumulated = np.cumsum(expense)
+        book = total_cents - accumulated
+    else:
+        # Diimpor saat dibutuhkan agar startup aplikasi tidak menunggu Numba
+        from logic_numba import ddb_core
+
+        expense = np.empty(num_months + 1, dtype=np.int64)
+        accumulated = np.empty(num_months + 1, dtype=np.int64)
+        book = np.empty(num_months + 1, dtype=np.int64)
+        ddb_core(total_cents, num_months, expense, accumulated, book)
+
+    return _schedule_columns(start_date, dates, expense / 100, accumulated / 100, book / 100)
+
+def _calculate_straight_line_schedule(total_cost: Decimal, start_date: datetime, dates: list):
     """
     Menghitung jadwal amortisasi menggunakan metode garis lurus.
     """
-    monthly_amortization = (total_cost / Decimal(num_months)).quantize(Decimal("0.01"))
+    num_months = len(dates)
+    zero = _ZERO
+    monthly_amortization = (total_cost / Decimal(num_months)).quantize(_Q2)
     
-    schedule_data = []
-    accumulated_amortization = Decimal("0.00")
+    accumulated_amortization = zero
     book_value = total_cost
     
     # Baris awal (Periode 0)
-    schedule_data.append([
-        0,
-        start_date,
-        'Initial Value',
-        Decimal("0.00"),
-        Decimal("0.00"),
-        book_value
-    ])
+    expense_col = [zero]
+    accumulated_col = [zero]
+    book_col = [book_value]
+    append_expense = expense_col.append
+    append_accumulated = accumulated_col.append
+    append_book = book_col.append
     
     # Membuat jadwal untuk setiap bulan
     for i in range(1, num_months + 1):
-        # Hitung tanggal untuk periode saat ini
-        target_date = start_date + relativedelta(months=i-1)
-        # Menangani hari di akhir bulan (misal: 31 Jan -> 28/29 Feb)
-        _, days_in_month = monthrange(target_date.year, target_date.month)
-        day = min(start_date.day, days_in_month)
-        current_date = target_date.replace(day=day)
-
-        
         # Memastikan nilai buku adalah nol pada akhir periode
         if i == num_months:
             # Sisa amortisasi untuk bulan terakhir untuk memastikan nilai buku menjadi 0
             amortization_this_month = total_cost - accumulated_amortization
             accumulated_amortization = total_cost
-            book_value = Decimal("0.00")
+            book_value = zero
         else:
             amortization_this_month = monthly_amortization
             accumulated_amortization += monthly_amortization
             book_value -= monthly_amortization
             
-        schedule_data.append([
-            i,
-            current_date,
-            'Amortization',
-            amortization_this_month,
-            accumulated_amortization,
-            book_value
-        ])
+        append_expense(amortization_this_month)
+        append_accumulated(accumulated_amortization)
+        append_book(book_value)
         
-    return schedule_data
+    return _schedule_columns(start_date, dates, expense_col, accumulated_col, book_col)
 
-def _calculate_declining_balance_schedule(total_cost: Decimal, start_date: datetime, end_date: datetime, num_months: int):
+def _calculate_declining_balance_schedule(total_cost: Decimal, start_date: datetime, dates: list):
     """
     Menghitung jadwal amortisasi menggunakan metode saldo menurun ganda.
+    Perhitungan dilakukan dalam sen (bilangan bulat); nilai baru diubah
+    menjadi Decimal saat kolom disusun.
     """
-    if num_months == 0:
-        return []
+    num_months = len(dates)
 
-    # Tingkat penyusutan bulanan untuk saldo menurun ganda
-    # (2 / masa manfaat dalam bulan)
-    depreciation_rate = Decimal(2) / Decimal(num_months)
-
-    schedule_data = []
-    accumulated_amortization = Decimal("0.00")
-    book_value = total_cost
+    # Harga perolehan dalam sen, dibulatkan seperti quantize (ROUND_HALF_EVEN)
+    total_cents = int((total_cost * 100).to_integral_value())
+    accumulated_cents = 0
+    book_cents = total_cents
 
     # Baris awal (Periode 0)
-    schedule_data.append([
-        0,
-        start_date,
-        'Initial Value',
-        Decimal("0.00"),
-        Decimal("0.00"),
-        book_value
-    ])
+    expense_cents = [0]
+    accumulated_list = [0]
+    book_list = [total_cents]
 
     # Membuat jadwal untuk setiap bulan
     for i in range(1, num_months + 1):
-        # Hitung tanggal untuk periode saat ini
-        target_date = start_date + relativedelta(months=i-1)
-        # Menangani hari di akhir bulan (misal: 31 Jan -> 28/29 Feb)
-        _, days_in_month = monthrange(target_date.year, target_date.month)
-        day = min(start_date.day, days_in_month)
-        current_date = target_date.replace(day=day)
-        
-        current_book_value = total_cost - accumulated_amortization
-
         # Memastikan nilai buku adalah nol pada akhir periode
         if i == num_months:
-            amortization_this_month = current_book_value
+            amortization_this_month = book_cents
         else:
-            # Amortisasi untuk bulan ini
-            amortization_this_month = (current_book_value * depreciation_rate).quantize(Decimal("0.01"))
+            # Amortisasi untuk bulan ini: nilai buku x (2 / masa manfaat dalam bulan),
+            # dibulatkan ke sen terdekat (setengah ke genap, seperti quantize)
+            amortization_this_month, remainder = divmod(book_cents * 2, num_months)
+            if remainder * 2 > num_months or (remainder * 2 == num_months and amortization_this_month % 2):
+                amortization_this_month += 1
 
             # Jangan biarkan beban amortisasi melebihi sisa nilai buku.
             # Ini penting jika tingkat penyusutan sangat tinggi pada aset dengan masa manfaat pendek.
-            if amortization_this_month > current_book_value:
-                amortization_this_month = current_book_value
-
-        accumulated_amortization += amortization_this_month
-        book_value -= amortization_this_month
+            if amortization_this_month > book_cents:
+                amortization_this_month = book_cents
+
+        accumulated_cents += amortization_this_month
+        book_cents -= amortization_this_month
+
+        expense_cents.append(amortization_this_month)
+        accumulated_list.append(accumulated_cents)
+        book_list.append(book_cents)
+
+    # Mengubah sen menjadi Decimal dengan dua desimal; baris awal memakai harga perolehan asli
+    to_decimal = lambda cents: Decimal(cents).scaleb(-2)
+    book_col = [total_cost] + [to_decimal(c) for c in book_list[1:]]
+    return _schedule_columns(
+        start_date, dates,
+        [to_decimal(c) for c in expense_cents],
+        [to_decimal(c) for c in accumulated_list],
+        book_col,
+    )
+
+def calculate_amortization_schedule(total_cost: Decimal, start_date: datetime, end_date: datetime, method: str, use_decimal: bool = False):
+    """
+    Menghitung jadwal amortisasi berdasarkan metode yang dipilih.
+    Hasil untuk input yang sama diambil dari cache; pemanggil menerima salinan
+    DataFrame sehingga tidak dapat mengubah isi cache.
+    """
+    schedule_df, error_msg = _cached_amortization_schedule(total_cost, start_date, end_date, method, use_decimal)
+    if error_msg:
+        return None, error_msg
+    return schedule_df.copy(), None
 
-        # Ensure book value doesn't become a tiny negative number on the last run
-        if i == num_months:
-            book_value = Decimal("0.00")
-        
-        schedule_data.append([
-            i,
-            current_date,
-            'Amortization',
-            amortization_this_month,
-            accumulated_amortization,
-            book_value if book_value > Decimal("0") else Decimal("0.00")
-        ])
-
-    return schedule_data
-
-def calculate_amortization_schedule(total_cost: Decimal, start_date: datetime, end_date: datetime, method: str):
+@lru_cache(maxsize=32)
+def _cached_amortization_schedule(total_cost: Decimal, start_date: datetime, end_date: datetime, method: str, use_decimal: bool):
     """
     Menghitung jadwal amortisasi berdasarkan metode yang dipilih.
+    Secara default perhitungan memakai sen (int64) yang dikompilasi dan
+    menghasilkan kolom float64; gunakan use_decimal=True untuk kolom Decimal.
+    Kedua jalur membulatkan dengan cara yang sama, sehingga nilainya identik.
     Mengembalikan DataFrame dengan tipe data numerik mentah.
     """
     num_months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month) + 1
@@ -135,18 +195,20 @@ def calculate_amortization_schedule(total_cost: Decimal, start_date: datetime, e
     if num_months <= 0:
         return None, "Periode sewa tidak valid. Tanggal selesai harus setelah tanggal mulai."
 
-    if method == 'Straight-Line':
-        schedule_data = _calculate_straight_line_schedule(total_cost, start_date, end_date, num_months)
-    elif method == 'Double Declining Balance':
-        schedule_data = _calculate_declining_balance_schedule(total_cost, start_date, end_date, num_months)
-    else:
+    if method not in ('Straight-Line', 'Double Declining Balance'):
         return None, f"Metode amortisasi tidak diketahui: {method}"
 
-    columns = [
-        'Periode', 'Tanggal', 'Deskripsi',
-        'Beban Amortisasi', 'Akumulasi Amortisasi', 'Nilai Buku'
-    ]
-    
-    schedule_df = pd.DataFrame(schedule_data, columns=columns)
+    # Hitung semua tanggal periode sekali saja, lalu berikan ke fungsi perhitungan
+    dates = _build_period_dates(start_date, num_months)
+
+    if not use_decimal:
+        schedule_data = _calculate_schedule_float(total_cost, start_date, dates, method)
+    elif method == 'Straight-Line':
+        schedule_data = _calculate_straight_line_schedule(total_cost, start_date, dates)
+    else:
+        schedule_data = _calculate_declining_balance_schedule(total_cost, start_date, dates)
+
+    # Kolom sudah tersusun per kolom, jadi pandas tidak perlu mentransposisi baris
+    schedule_df = pd.DataFrame(schedule_data, copy=False)
     
     return schedule_df, None
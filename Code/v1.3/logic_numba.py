@@ -0,0 +1,51 @@
+"""
+Inti perhitungan jadwal amortisasi dalam sen (bilangan bulat int64).
+Fungsi-fungsi ini dikompilasi dengan Numba jika tersedia, dan mengisi
+array yang sudah dialokasikan sebelumnya (indeks 0 adalah baris awal / Periode 0).
+Setiap nilai dibulatkan ke sen terdekat (setengah ke genap), sama seperti
+quantize pada versi Decimal, sehingga hasilnya identik.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba bersifat opsional; tanpa Numba fungsi berjalan sebagai Python biasa
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+@njit(cache=True)
+def _div_round(numerator, denominator):
+    """Pembagian bilangan bulat yang dibulatkan ke sen terdekat, setengah ke genap."""
+    quotient = numerator // denominator
+    remainder = numerator - quotient * denominator
+    if remainder * 2 > denominator or (remainder * 2 == denominator and quotient % 2 == 1):
+        quotient += 1
+    return quotient
+
+
+@njit(cache=True)
+def ddb_core(total_cents, num_months, out_expense, out_accum, out_book):
+    """Mengisi jadwal metode saldo menurun ganda."""
+    out_expense[0] = 0
+    out_accum[0] = 0
+    out_book[0] = total_cents
+
+    accum = 0
+    book = total_cents
+    for i in range(1, num_months + 1):
+        # Memastikan nilai buku adalah nol pada akhir periode
+        if i == num_months:
+            expense = book
+        else:
+            # Nilai buku x (2 / masa manfaat dalam bulan)
+            expense = _div_round(book * 2, num_months)
+            # Jangan biarkan beban amortisasi melebihi sisa nilai buku
+            if expense > book:
+                expense = book
+        accum += expense
+        book -= expense
+
+        out_expense[i] = expense
+        out_accum[i] = accum
+        out_book[i] = book
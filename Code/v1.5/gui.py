@@ -22,6 +22,9 @@ AMORTIZATION_METHODS = [METHOD_STRAIGHT_LINE, METHOD_DECLINING_BALANCE, METHOD_S
 COLUMNS = ('Period', 'Date', 'Description', 'Expense', 'Accumulated', 'Book Value')
 NUMERIC_COLUMNS = ['Amortization Expense', 'Accumulated Amortization', 'Book Value']
 
+# Swaps ',' and '.' in one pass to turn '1,000.50' into '1.000,50'
+_SWAP = str.maketrans({',': '.', '.': ','})
+
 # --- Utility Functions ---
 
 def parse_flexible_date(date_string: str) -> datetime:
@@ -164,7 +167,7 @@ class AmortizationApp(tk.Tk):
             locale.setlocale(locale.LC_ALL, 'id_ID')
             self.format_currency = lambda val: locale.format_string('%.2f', val, grouping=True)
         except locale.Error:
-            self.format_currency = lambda val: f"{val:,.2f}".replace(',', '#').replace('.', ',').replace('#', '.')
+            self.format_currency = lambda val: f"{val:,.2f}".translate(_SWAP)
 
     def _create_input_widgets(self, parent_frame: ttk.Frame) -> None:
         parent_frame.columnconfigure(1, weight=1)
@@ -265,14 +268,15 @@ class AmortizationApp(tk.Tk):
         if self.schedule_df is None:
             return
 
-        for _, row in self.schedule_df.iterrows():
+        rows = self.schedule_df.itertuples(index=False, name=None)
+        for period, date, description, expense, accumulated, book_value in rows:
             formatted_values = [
-                row['Period'],
-                row['Date'].strftime(DATE_FORMAT),
-                row['Description'],
-                self.format_currency(row['Amortization Expense']),
-                self.format_currency(row['Accumulated Amortization']),
-                self.format_currency(row['Book Value'])
+                period,
+                date.strftime(DATE_FORMAT),
+                description,
+                self.format_currency(expense),
+                self.format_currency(accumulated),
+                self.format_currency(book_value)
             ]
             self.tree.insert("", "end", values=formatted_values)
 
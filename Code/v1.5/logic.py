@@ -1,205 +1,106 @@
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from dateutil.relativedelta import relativedelta
-from decimal import Decimal, getcontext
+from decimal import Decimal, localcontext
 
 from calendar import monthrange
-# Set precision for Decimal calculations
-getcontext().prec = 28
-
-def _calculate_straight_line_schedule(total_cost: Decimal, start_date: datetime, end_date: datetime, num_months: int):
-    """Calculates the amortization schedule using the straight-line method."""
-    monthly_amortization = (total_cost / Decimal(num_months)).quantize(Decimal("0.01")) if num_months > 0 else Decimal("0")
-    
-    schedule_data = []
-    accumulated_amortization = Decimal("0.00")
-    book_value = total_cost
-    
-    # Baris awal (Periode 0)
-    schedule_data.append([
-        0,
-        start_date,
-        'Initial Value',
-        Decimal("0.00"),
-        Decimal("0.00"),
-        book_value
-    ])
-    
-    # Create schedule for each month
-    for i in range(1, num_months + 1):
-        # Calculate date for the current period
-        target_date = start_date + relativedelta(months=i-1)
+from functools import lru_cache
+
+@lru_cache(maxsize=4096)
+def _days_in_month(year: int, month: int) -> int:
+    """Returns the number of days in the given month (cached)."""
+    return monthrange(year, month)[1]
+
+def _to_cents(d: Decimal) -> int:
+    """Converts a currency amount to an integer number of cents."""
+    # Use a local context so the conversion does not depend on (or change) the global precision
+    with localcontext() as ctx:
+        ctx.prec = 28
+        return int((d * 100).to_integral_value())
+
+def _month_dates(start_date: datetime, num_months: int):
+    """Returns the date of each period, keeping the start day where the month allows."""
+    year, month, start_day = start_date.year, start_date.month, start_date.day
+    dates = []
+    for i in range(num_months):
+        total = (month - 1) + i
+        y = year + total // 12
+        m = total % 12 + 1
         # Handle end-of-month days (e.g., Jan 31 -> Feb 28/29)
-        _, days_in_month = monthrange(target_date.year, target_date.month)
-        day = min(start_date.day, days_in_month)
-        current_date = target_date.replace(day=day)
-
-        amortization_this_month = monthly_amortization
-        # On the last month, adjust the expense to exactly zero out the book value, handling any rounding differences.
-        if i == num_months:
-            amortization_this_month = book_value
-
-        accumulated_amortization += amortization_this_month
-        book_value -= amortization_this_month
-            
-        schedule_data.append([
-            i,
-            current_date,
-            'Amortization',
-            amortization_this_month,
-            accumulated_amortization,
-            book_value if book_value > Decimal("0") else Decimal("0.00")
-        ])
-        
-    return schedule_data
-
-def _calculate_declining_balance_schedule(total_cost: Decimal, start_date: datetime, end_date: datetime, num_months: int):
+        days_in_month = _days_in_month(y, m)
+        dates.append(start_date.replace(year=y, month=m, day=min(start_day, days_in_month)))
+    return dates
+
+@lru_cache(maxsize=32)
+def _soyd_weights(num_months: int):
+    """Returns the SOYD weight table (remaining life per month) and its sum, shared across schedules."""
+    weights = np.arange(num_months, 0, -1, dtype=np.int64)
+    weights.flags.writeable = False
+    return weights, num_months * (num_months + 1) // 2
+
+def _build_schedule_columns(start_date: datetime, cents: np.ndarray):
+    """Builds the schedule columns from a kernel's (expense, accumulated, book value) cent rows."""
+    num_months = cents.shape[1] - 1
+    expense, accumulated, book = cents / 100
+
+    return {
+        'Period': np.arange(num_months + 1),
+        'Date': [start_date] + _month_dates(start_date, num_months),
+        'Description': ['Initial Value'] + ['Amortization'] * num_months,
+        'Amortization Expense': expense,
+        'Accumulated Amortization': accumulated,
+        'Book Value': book,
+    }
+
+def _calculate_straight_line_schedule(total_cents: int, start_date: datetime, num_months: int):
+    """Calculates the amortization schedule using the straight-line method."""
+    # Imported lazily so app startup does not pay for Numba
+    from logic_kernels import sl_kernel
+
+    return _build_schedule_columns(start_date, sl_kernel(total_cents, num_months))
+
+def _calculate_declining_balance_schedule(total_cents: int, start_date: datetime, num_months: int):
     """Calculates the amortization schedule using the double-declining balance method."""
-    if num_months == 0:
-        return []
-
-    # Monthly depreciation rate for double-declining balance (2 / useful life in months)
-    depreciation_rate = Decimal(2) / Decimal(num_months)
-
-    schedule_data = []
-    accumulated_amortization = Decimal("0.00")
-    book_value = total_cost
-
-    # Baris awal (Periode 0)
-    schedule_data.append([
-        0,
-        start_date,
-        'Initial Value',
-        Decimal("0.00"),
-        Decimal("0.00"),
-        book_value
-    ])
-
-    # Create schedule for each month
-    for i in range(1, num_months + 1):
-        # Calculate date for the current period
-        target_date = start_date + relativedelta(months=i-1)
-        # Handle end-of-month days (e.g., Jan 31 -> Feb 28/29)
-        _, days_in_month = monthrange(target_date.year, target_date.month)
-        day = min(start_date.day, days_in_month)
-        current_date = target_date.replace(day=day)
-        
-        remaining_life = num_months - i + 1
-        current_book_value = book_value # Use book_value from previous period
-
-        # Ensure book value is zero at the end of the period
-        if i == num_months:
-            amortization_this_month = current_book_value
-        else:
-            # Calculate depreciation using both DDB and Straight-Line on remaining value
-            ddb_amortization = (current_book_value * depreciation_rate).quantize(Decimal("0.01"))
-            
-            # Straight-line depreciation on the remaining book value over the remaining life
-            sl_amortization = (current_book_value / Decimal(remaining_life)).quantize(Decimal("0.01"))
-
-            # Switch to straight-line if it provides a larger depreciation expense
-            amortization_this_month = max(ddb_amortization, sl_amortization)
-
-            # Do not let the amortization expense exceed the remaining book value.
-            if amortization_this_month > current_book_value:
-                amortization_this_month = current_book_value
-
-        accumulated_amortization += amortization_this_month
-        book_value -= amortization_this_month
-
-        # Ensure book value doesn't become a tiny negative number on the last run
-        if i == num_months:
-            book_value = Decimal("0.00")
-        
-        schedule_data.append([
-            i,
-            current_date,
-            'Amortization',
-            amortization_this_month,
-            accumulated_amortization,
-            book_value if book_value > Decimal("0") else Decimal("0.00")
-        ])
-
-    return schedule_data
-
-def _calculate_soyd_schedule(total_cost: Decimal, start_date: datetime, end_date: datetime, num_months: int):
+    from logic_kernels import ddb_kernel
+
+    return _build_schedule_columns(start_date, ddb_kernel(total_cents, num_months))
+
+def _calculate_soyd_schedule(total_cents: int, start_date: datetime, num_months: int):
     """Calculates the amortization schedule using the Sum-of-the-Years' Digits (SOYD) method."""
-    if num_months == 0:
-        return []
-
-    # Calculate the Sum-of-the-Years' Digits (for months)
-    soyd = Decimal(num_months * (num_months + 1)) / Decimal(2)
-
-    schedule_data = []
-    accumulated_amortization = Decimal("0.00")
-    book_value = total_cost
-
-    # Initial row (Period 0)
-    schedule_data.append([
-        0,
-        start_date,
-        'Initial Value',
-        Decimal("0.00"),
-        Decimal("0.00"),
-        book_value
-    ])
-
-    # Create schedule for each month
-    for i in range(1, num_months + 1):
-        # Calculate date for the current period
-        target_date = start_date + relativedelta(months=i-1)
-        _, days_in_month = monthrange(target_date.year, target_date.month)
-        day = min(start_date.day, days_in_month)
-        current_date = target_date.replace(day=day)
-
-        # On the last month, the amortization is simply the remaining book value.
-        if i == num_months:
-            amortization_this_month = book_value
-        else:
-            # Remaining life in months
-            remaining_life = Decimal(num_months - i + 1)
-            # Amortization for this month
-            amortization_this_month = (total_cost * (remaining_life / soyd)).quantize(Decimal("0.01"))
-
-        # Ensure expense does not exceed the book value (important for rounding)
-        if amortization_this_month > book_value and i != num_months:
-            amortization_this_month = book_value
-
-        accumulated_amortization += amortization_this_month
-        book_value -= amortization_this_month
-
-        schedule_data.append([
-            i,
-            current_date,
-            'Amortization',
-            amortization_this_month,
-            accumulated_amortization,
-            book_value if book_value > Decimal("0") else Decimal("0.00")
-        ])
-
-    return schedule_data
+    from logic_kernels import soyd_kernel
 
-def calculate_amortization_schedule(total_cost: Decimal, start_date: datetime, end_date: datetime, method: str):
-    """Calculates the amortization schedule based on the selected method."""
+    weights, soyd = _soyd_weights(num_months)
+    return _build_schedule_columns(start_date, soyd_kernel(total_cents, weights, soyd))
+
+@lru_cache(maxsize=32)
+def _cached_schedule(total_cents: int, start_ord: int, end_ord: int, method: str):
+    """Builds the schedule DataFrame for hashable inputs; repeated calls hit the cache."""
+    start_date = datetime.fromordinal(start_ord)
+    end_date = datetime.fromordinal(end_ord)
     num_months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month) + 1
-    
-    if num_months <= 0:
-        return None, "Invalid lease period. The end date must be after the start date."
 
     if method == 'Straight-Line':
-        schedule_data = _calculate_straight_line_schedule(total_cost, start_date, end_date, num_months)
+        schedule_data = _calculate_straight_line_schedule(total_cents, start_date, num_months)
     elif method == 'Double Declining Balance':
-        schedule_data = _calculate_declining_balance_schedule(total_cost, start_date, end_date, num_months)
+        schedule_data = _calculate_declining_balance_schedule(total_cents, start_date, num_months)
     elif method == "Sum-of-the-Years Digits":
-        schedule_data = _calculate_soyd_schedule(total_cost, start_date, end_date, num_months)
+        schedule_data = _calculate_soyd_schedule(total_cents, start_date, num_months)
     else:
         return None, f"Unknown amortization method: {method}"
 
-    columns = [
-        'Period', 'Date', 'Description', 'Amortization Expense',
-        'Accumulated Amortization', 'Book Value'
-    ]
-    
-    schedule_df = pd.DataFrame(schedule_data, columns=columns)
+    return pd.DataFrame(schedule_data), None
+
+def calculate_amortization_schedule(total_cost: Decimal, start_date: datetime, end_date: datetime, method: str):
+    """Calculates the amortization schedule based on the selected method."""
+    num_months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month) + 1
     
-    return schedule_df, None
\ No newline at end of file
+    if num_months <= 0:
+        return None, "Invalid lease period. The end date must be after the start date."
+
+    # All schedule arithmetic is done in integer cents
+    schedule_df, error_msg = _cached_schedule(_to_cents(total_cost), start_date.toordinal(), end_date.toordinal(), method)
+    if error_msg:
+        return None, error_msg
+
+    # Hand out a copy so callers cannot mutate the cached DataFrame
+    return schedule_df.copy(deep=False), None
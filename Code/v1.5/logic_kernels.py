@@ -0,0 +1,64 @@
+"""
+Integer-cent schedule kernels used by logic.py.
+Each kernel returns a (3, num_months + 1) int64 array holding the
+amortization expense, accumulated amortization and book value per period,
+with the initial row (Period 0) in column 0.
+The kernels are JIT-compiled with Numba when it is installed.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the kernels run as plain NumPy code
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+@njit(cache=True)
+def _accumulate(total_cents, out):
+    """Fills the accumulated amortization and book value rows from the expense row."""
+    out[1, 1:] = np.cumsum(out[0, 1:])
+    out[2, :] = total_cents - out[1, :]
+    return out
+
+
+@njit(cache=True)
+def sl_kernel(total_cents, num_months):
+    """Straight-line: a constant expense, with the rounding remainder in the last month."""
+    out = np.zeros((3, num_months + 1), dtype=np.int64)
+    out[0, 1:] = total_cents // num_months
+    out[0, num_months] += total_cents - out[0, 1:].sum()
+    return _accumulate(total_cents, out)
+
+
+@njit(cache=True)
+def ddb_kernel(total_cents, num_months):
+    """Double-declining balance, switching to straight-line when that is larger."""
+    out = np.zeros((3, num_months + 1), dtype=np.int64)
+    book = total_cents
+    for i in range(1, num_months + 1):
+        # Ensure book value is zero at the end of the period
+        if i == num_months:
+            amort = book
+        else:
+            ddb = (book * 2) // num_months
+            sl = book // (num_months - i + 1)
+            amort = ddb if ddb > sl else sl
+            # Do not let the expense exceed the remaining book value
+            if amort > book:
+                amort = book
+        out[0, i] = amort
+        book -= amort
+    return _accumulate(total_cents, out)
+
+
+@njit(cache=True)
+def soyd_kernel(total_cents, weights, soyd):
+    """Sum-of-the-Years' Digits: each month is weighted by its remaining life."""
+    num_months = weights.shape[0]
+    out = np.zeros((3, num_months + 1), dtype=np.int64)
+    out[0, 1:] = (total_cents * weights) // soyd
+    out[0, num_months] += total_cents - out[0, 1:].sum()
+    return _accumulate(total_cents, out)
@@ -4,8 +4,10 @@ import pandas as pd
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 import locale
 import os
+import threading
 
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
@@ -14,7 +16,6 @@ from logic import calculate_amortization_schedule
 
 # --- Constants ---
 DATE_FORMAT = "%Y-%m-%d"
-SUPPORTED_DATE_FORMATS = [DATE_FORMAT, "%Y%m%d"]
 
 METHOD_STRAIGHT_LINE = 'Straight-Line'
 METHOD_DECLINING_BALANCE = 'Double Declining Balance'
@@ -23,20 +24,45 @@ AMORTIZATION_METHODS = [METHOD_STRAIGHT_LINE, METHOD_DECLINING_BALANCE, METHOD_S
 
 COLUMNS = ('Period', 'Date', 'Description', 'Expense', 'Accumulated', 'Book Value')
 NUMERIC_COLUMNS = ['Amortization Expense', 'Accumulated Amortization', 'Book Value']
+TREE_CHUNK_SIZE = 200 # Rows inserted into the table per event-loop pass
+
+_ZERO = Decimal("0")
+
+# Translation table deleting every ASCII character except digits, '.' and ','
+_NON_NUMERIC = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if not (chr(c).isdigit() or chr(c) in '.,')
+))
 
 # --- Utility Functions ---
 
 def parse_flexible_date(date_string: str) -> datetime:
-    """Parses a date string from one of the supported formats."""
-    date_string = date_string.strip()    
-    formats_to_try = SUPPORTED_DATE_FORMATS
-    for fmt in formats_to_try:
+    """Parses a date string in 'YYYY-MM-DD' or 'YYYYMMDD' format."""
+    s = date_string.strip()
+    if len(s) == 10 and s[4] == '-' and s[7] == '-':
+        digits = s[:4] + s[5:7] + s[8:]
+    elif len(s) == 8:
+        digits = s
+    else:
+        digits = ''
+
+    # Slice the fields directly instead of having strptime parse a format string
+    if digits.isascii() and digits.isdigit():
         try:
-            return datetime.strptime(date_string, fmt)
+            return datetime(int(digits[:4]), int(digits[4:6]), int(digits[6:]))
         except ValueError:
-            continue
+            pass  # Out-of-range month or day
     raise ValueError("Invalid date format. Use 'YYYY-MM-DD' or 'YYYYMMDD'.")
 
+# Schedules repeat the same amounts a lot (zero, the straight-line expense),
+# so formatted strings are cached per value.
+@lru_cache(maxsize=4096)
+def _format_currency_locale(val: float) -> str:
+    return locale.format_string('%.2f', val, grouping=True)
+
+@lru_cache(maxsize=4096)
+def _format_currency_plain(val: float) -> str:
+    return f"{val:,.2f}"
+
 class AmortizationApp(tk.Tk):
     def __init__(self) -> None:
         super().__init__()
@@ -69,6 +95,12 @@ class AmortizationApp(tk.Tk):
         self.start_date_var = tk.StringVar(value=datetime.now().strftime('%Y-%m-01'))
         self.end_date_var = tk.StringVar(value=(datetime.now() + relativedelta(years=1, days=-1)).strftime(DATE_FORMAT))
         self.schedule_df: pd.DataFrame | None = None
+        self._last_inputs: tuple | None = None # Inputs behind the schedule currently shown
+        self._pending_inputs: tuple | None = None
+        self._calc_generation = 0 # Bumped by Reset Form so a late worker result is dropped
+        self._full_rows: list = [] # Pre-formatted rows for the table
+        self._next_row = 0
+        self._insert_job = None # Pending after_idle job while the table is being filled
 
         self._create_input_widgets(input_frame)
         self._create_action_buttons(main_frame)
@@ -132,6 +164,9 @@ class AmortizationApp(tk.Tk):
         self.end_date_var.set((datetime.now() + relativedelta(years=1, days=-1)).strftime(DATE_FORMAT))
         
         self.schedule_df = None
+        self._last_inputs = None
+        self._calc_generation += 1
+        self._cancel_tree_fill()
         self.tree.delete(*self.tree.get_children())
         if self.chart_canvas:
             self.chart_canvas.get_tk_widget().destroy()
@@ -143,9 +178,9 @@ class AmortizationApp(tk.Tk):
     def setup_locale(self) -> None:
         try:
             locale.setlocale(locale.LC_ALL, 'id_ID')
-            self.format_currency = lambda val: locale.format_string('%.2f', val, grouping=True)
+            self._currency_formatter = _format_currency_locale
         except locale.Error:
-            self.format_currency = lambda val: f"{val:,.2f}"
+            self._currency_formatter = _format_currency_plain
 
     def _format_currency_input(self, var: tk.StringVar):
         """Standardizes input to allow for calculations while keeping user friendly formatting."""
@@ -182,7 +217,8 @@ class AmortizationApp(tk.Tk):
         button_frame = ttk.Frame(parent_frame)
         button_frame.pack(fill=tk.X, pady=(0, 10))
 
-        ttk.Button(button_frame, text="Calculate & Plot", command=self._perform_calculation, style="Accent.TButton").pack(side=tk.LEFT)
+        self.calculate_button = ttk.Button(button_frame, text="Calculate & Plot", command=self._perform_calculation, style="Accent.TButton")
+        self.calculate_button.pack(side=tk.LEFT)
         self.save_button = ttk.Button(button_frame, text="Save to Excel", command=self._save_to_excel, state='disabled')
         self.save_button.pack(side=tk.LEFT, padx=10)
 
@@ -195,19 +231,22 @@ class AmortizationApp(tk.Tk):
             anchor = tk.E if col not in ['Description', 'Date'] else tk.W
             self.tree.column(col, anchor=anchor, width=90)
 
-        v_scroll = ttk.Scrollbar(parent_frame, orient="vertical", command=self.tree.yview)
+        self.v_scroll = ttk.Scrollbar(parent_frame, orient="vertical", command=self.tree.yview)
         h_scroll = ttk.Scrollbar(parent_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scroll.set, xscrollcommand=h_scroll.set)
+        self.tree.configure(yscrollcommand=self.v_scroll.set, xscrollcommand=h_scroll.set)
 
         parent_frame.grid_rowconfigure(0, weight=1)
         parent_frame.grid_columnconfigure(0, weight=1)
         self.tree.grid(row=0, column=0, sticky='nsew')
-        v_scroll.grid(row=0, column=1, sticky='ns')
+        self.v_scroll.grid(row=0, column=1, sticky='ns')
         h_scroll.grid(row=1, column=0, sticky='ew')
 
     def _parse_currency(self, val: str) -> Decimal:
-        # Remove currency symbols and grouping separators, keep decimal point
-        clean = ''.join(c for c in val if c.isdigit() or c == '.' or c == ',')
+        # Remove currency symbols and other characters, keep digits and separators
+        if val.isascii():
+            clean = val.translate(_NON_NUMERIC)
+        else:
+            clean = ''.join(c for c in val if c.isdigit() or c == '.' or c == ',')
         # If both . and , are present, assume last one is decimal
         if '.' in clean and ',' in clean:
              if clean.rfind('.') > clean.rfind(','):
@@ -221,7 +260,7 @@ class AmortizationApp(tk.Tk):
                  clean = clean.replace(',', '.')
         
         if not clean:
-             return Decimal("0")
+             return _ZERO
         return Decimal(clean)
 
     def _validate_and_get_inputs(self) -> tuple | None:
@@ -254,37 +293,57 @@ class AmortizationApp(tk.Tk):
             return None
 
     def _perform_calculation(self) -> None:
+        inputs = self._validate_and_get_inputs()
+
+        # Nothing changed since the last successful run: keep the table and chart as they are
+        if inputs and inputs == self._last_inputs and self.schedule_df is not None:
+            self.status_var.set("Schedule is already up to date.")
+            return
+
         self.schedule_df = None
+        self._last_inputs = None
+        self._cancel_tree_fill()
         self.tree.delete(*self.tree.get_children())
         if self.chart_canvas:
             self.chart_canvas.get_tk_widget().destroy()
             self.chart_canvas = None
 
-        inputs = self._validate_and_get_inputs()
         if not inputs:
             return
         
-        total_cost, salvage_value, start_date, end_date, method = inputs
-        
-        df, error_msg = calculate_amortization_schedule(total_cost, salvage_value, start_date, end_date, method)
+        # Compute on a worker thread so the window keeps responding;
+        # the button stays disabled until the result is back on the Tk thread.
+        self.calculate_button.config(state='disabled')
+        self.save_button.config(state='disabled')
+        self.status_var.set("Calculating...")
+        self._pending_inputs = inputs
+        threading.Thread(target=self._calc_worker, args=(self._calc_generation, *inputs), daemon=True).start()
+
+    def _calc_worker(self, generation: int, total_cost: Decimal, salvage_value: Decimal, start_date: datetime, end_date: datetime, method: str) -> None:
+        """Runs on the worker thread; only hands the result back via after()."""
+        try:
+            df, error_msg = calculate_amortization_schedule(total_cost, salvage_value, start_date, end_date, method)
+        except Exception as e:
+            df, error_msg = None, str(e)
+        self.after(0, self._calc_done, generation, df, error_msg)
+
+    def _calc_done(self, generation: int, df: pd.DataFrame | None, error_msg: str | None) -> None:
+        """Runs on the Tk thread once the worker has finished."""
+        self.calculate_button.config(state='normal')
+
+        # The form was reset while this worker ran; its result no longer applies
+        if generation != self._calc_generation:
+            return
 
         if error_msg:
+            self.status_var.set("")
             messagebox.showerror("Calculation Error", error_msg)
             return
 
         self.schedule_df = df
+        self._last_inputs = self._pending_inputs
         
-        # Populate Table
-        for _, row in self.schedule_df.iterrows():
-            formatted_values = [
-                row['Period'],
-                row['Date'].strftime(DATE_FORMAT),
-                row['Description'],
-                self.format_currency(row['Amortization Expense']),
-                self.format_currency(row['Accumulated Amortization']),
-                self.format_currency(row['Book Value'])
-            ]
-            self.tree.insert("", "end", values=formatted_values)
+        self._populate_treeview(df)
 
         # Plot Chart
         self._plot_chart(df)
@@ -292,6 +351,52 @@ class AmortizationApp(tk.Tk):
         self.status_var.set("Calculation successful.")
         self.save_button.config(state='normal')
         
+    def _populate_treeview(self, df: pd.DataFrame) -> None:
+        """Fills the schedule table, formatting each column in one pass before inserting."""
+        # The money columns are already float64, so tolist() yields plain floats that go
+        # straight into the cached formatter without a per-value conversion
+        formatter = self._currency_formatter
+        self._full_rows = list(zip(
+            df['Period'].tolist(),
+            df['Date'].dt.strftime(DATE_FORMAT).tolist(),
+            df['Description'].tolist(),
+            map(formatter, df['Amortization Expense'].tolist()),
+            map(formatter, df['Accumulated Amortization'].tolist()),
+            map(formatter, df['Book Value'].tolist())
+        ))
+        self._next_row = 0
+        # Unhook the scrollbar while filling so the visible range isn't recomputed
+        # for every inserted row; it is reattached once the last chunk is in.
+        self.tree.configure(yscrollcommand='')
+        # Show the first rows right away; the rest follow in idle time after the first paint
+        self._insert_next_chunk()
+
+    def _insert_next_chunk(self) -> None:
+        """Inserts the next TREE_CHUNK_SIZE rows and schedules another pass if rows remain."""
+        start = self._next_row
+        end = min(start + TREE_CHUNK_SIZE, len(self._full_rows))
+        insert = self.tree.insert
+        for formatted_values in self._full_rows[start:end]:
+            insert("", "end", values=formatted_values)
+        self._next_row = end
+
+        if end < len(self._full_rows):
+            self._insert_job = self.after_idle(self._insert_next_chunk)
+        else:
+            self._insert_job = None
+            self._reattach_scrollbar()
+
+    def _cancel_tree_fill(self) -> None:
+        """Stops a chunked Treeview fill that is still in progress."""
+        if self._insert_job is not None:
+            self.after_cancel(self._insert_job)
+            self._insert_job = None
+            self._reattach_scrollbar()
+
+    def _reattach_scrollbar(self) -> None:
+        self.tree.configure(yscrollcommand=self.v_scroll.set)
+        self.v_scroll.set(*self.tree.yview())
+
     def _plot_chart(self, df: pd.DataFrame) -> None:
         fig = Figure(figsize=(5, 4), dpi=100)
         ax = fig.add_subplot(111)
@@ -320,7 +425,11 @@ class AmortizationApp(tk.Tk):
             
         try:
             default_filename = f"Schedule_{self.asset_name_var.get()}.xlsx".replace(" ", "_")
-            self.schedule_df.to_excel(default_filename, index=False)
+            with pd.ExcelWriter(default_filename, engine='xlsxwriter') as writer:
+                self.schedule_df.to_excel(writer, sheet_name='Schedule', index=False)
+                # One number format on the money columns (D:F) instead of styling each cell
+                money_fmt = writer.book.add_format({'num_format': '#,##0.00'})
+                writer.sheets['Schedule'].set_column('D:F', 18, money_fmt)
             messagebox.showinfo("Success", f"Saved to {default_filename}")
         except Exception as e:
             messagebox.showerror("Error", str(e))
@@ -1,178 +1,135 @@
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from dateutil.relativedelta import relativedelta
-from decimal import Decimal, getcontext
-from calendar import monthrange
-
-# Set precision for Decimal calculations
-getcontext().prec = 28
-
-def _create_schedule_row(period, date, description, expense, accumulated, book_value):
-    return [period, date, description, expense, accumulated, book_value]
-
-def _calculate_straight_line_schedule(total_cost: Decimal, salvage_value: Decimal, start_date: datetime, num_months: int):
+from decimal import Decimal, localcontext
+from functools import lru_cache
+
+# Quantization step for money amounts, built once instead of on every call
+_CENTS = Decimal("0.01")
+
+# Days per month in a common year; February is adjusted for leap years
+_DAYS_IN_MONTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+def _to_cents(value: Decimal) -> int:
+    """Converts a money amount to whole cents, rounding half-to-even like the kernels."""
+    # A local context keeps the precision setting from leaking into the rest of the app
+    with localcontext() as ctx:
+        ctx.prec = 28
+        return int(value.quantize(_CENTS).scaleb(2))
+
+@lru_cache(maxsize=32)
+def _build_period_dates(start_date: datetime, num_months: int) -> pd.DatetimeIndex:
+    """
+    Returns the date of each period, keeping the start day where the month allows it.
+    This is the single date source for every method; the result is an immutable index,
+    so it is cached and shared between calculations with the same start and length.
+    """
+    orig_day = start_date.day
+
+    # Months since 1970-01 for every period, split into year and 0-based month
+    month_index = (start_date.year - 1970) * 12 + (start_date.month - 1) + np.arange(num_months)
+    years, months = np.divmod(month_index, 12)
+    years += 1970
+
+    # Table lookup for the month length; only February depends on the year
+    leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+    days_in_month = _DAYS_IN_MONTH[months] + ((months == 1) & leap)
+
+    # Clamp the day to the length of each month (e.g. 31 Jan -> 28/29 Feb)
+    days = np.minimum(orig_day, days_in_month)
+    dates = month_index.astype('datetime64[M]').astype('datetime64[us]') + (days - 1).astype('timedelta64[D]')
+    time_of_day = start_date - start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+    return pd.DatetimeIndex(dates + np.timedelta64(time_of_day))
+
+def _div_round(numerator, denominator):
+    """Integer division rounded to the nearest whole cent, ties to even (works on arrays too)."""
+    quotient, remainder = np.divmod(numerator, denominator)
+    return quotient + ((remainder * 2 > denominator) | ((remainder * 2 == denominator) & (quotient % 2 == 1)))
+
+def _schedule_columns(start_date: datetime, num_months: int, expense, accumulated, book_value) -> dict:
+    """Returns the schedule columns; money arrives in whole cents and is converted to float once here."""
+    return {
+        'Period': np.arange(num_months + 1),
+        'Date': _build_period_dates(start_date, num_months).insert(0, start_date),
+        'Description': ['Initial Value'] + ['Amortization'] * num_months,
+        'Amortization Expense': expense / 100,
+        'Accumulated Amortization': accumulated / 100,
+        'Book Value': book_value / 100,
+    }
+
+def _closed_form_schedule(total_cents: int, salvage_cents: int, start_date: datetime, monthly_cents) -> dict:
+    """
+    Builds the schedule from per-month expenses with a cumulative sum.
+    The accumulated amount is capped at the depreciable base, so the book value never
+    drops below salvage, and the last month absorbs any rounding remainder.
+    """
+    num_months = len(monthly_cents)
+    accumulated = np.zeros(num_months + 1, dtype=np.int64)
+    np.minimum(np.cumsum(monthly_cents), total_cents - salvage_cents, out=accumulated[1:])
+    accumulated[-1] = total_cents - salvage_cents
+    expense = np.diff(accumulated, prepend=0)
+    return _schedule_columns(start_date, num_months, expense, accumulated, total_cents - accumulated)
+
+def _calculate_straight_line_schedule(total_cents: int, salvage_cents: int, start_date: datetime, num_months: int):
     """Calculates the amortization schedule using the straight-line method."""
-    depreciable_base = total_cost - salvage_value
-    
-    if num_months <= 0:
-        return []
-        
-    monthly_amortization = (depreciable_base / Decimal(num_months)).quantize(Decimal("0.01"))
-    
-    schedule_data = []
-    accumulated_amortization = Decimal("0.00")
-    book_value = total_cost
-    
-    # Initial row
-    schedule_data.append(_create_schedule_row(
-        0, start_date, 'Initial Value', Decimal("0.00"), Decimal("0.00"), book_value
-    ))
-    
-    for i in range(1, num_months + 1):
-        target_date = start_date + relativedelta(months=i-1)
-        _, days_in_month = monthrange(target_date.year, target_date.month)
-        day = min(start_date.day, days_in_month)
-        current_date = target_date.replace(day=day)
-
-        amortization_this_month = monthly_amortization
-        
-        # Adjust last month to match salvage value exactly
-        if i == num_months:
-            amortization_this_month = book_value - salvage_value
-            
-        # Safety check: don't depreciate below salvage
-        if book_value - amortization_this_month < salvage_value:
-             amortization_this_month = book_value - salvage_value
-
-        accumulated_amortization += amortization_this_month
-        book_value -= amortization_this_month
-            
-        schedule_data.append(_create_schedule_row(
-            i, current_date, 'Amortization', amortization_this_month, accumulated_amortization, book_value
-        ))
-        
-    return schedule_data
+    monthly = _div_round(total_cents - salvage_cents, num_months)
+    return _closed_form_schedule(total_cents, salvage_cents, start_date, np.full(num_months, monthly, dtype=np.int64))
 
-def _calculate_declining_balance_schedule(total_cost: Decimal, salvage_value: Decimal, start_date: datetime, num_months: int):
+def _calculate_declining_balance_schedule(total_cents: int, salvage_cents: int, start_date: datetime, num_months: int):
     """Calculates the amortization schedule using the double-declining balance method."""
-    if num_months == 0:
-        return []
-
-    # Monthly depreciation rate for DDB (2 / useful life in months)
-    depreciation_rate = Decimal(2) / Decimal(num_months)
-
-    schedule_data = []
-    accumulated_amortization = Decimal("0.00")
-    book_value = total_cost
-
-    # Initial row
-    schedule_data.append(_create_schedule_row(
-        0, start_date, 'Initial Value', Decimal("0.00"), Decimal("0.00"), book_value
-    ))
-
-    for i in range(1, num_months + 1):
-        target_date = start_date + relativedelta(months=i-1)
-        _, days_in_month = monthrange(target_date.year, target_date.month)
-        day = min(start_date.day, days_in_month)
-        current_date = target_date.replace(day=day)
-        
-        current_book_value = book_value
-
-        # Stop if already at or below salvage value
-        if current_book_value <= salvage_value:
-             amortization_this_month = Decimal("0.00")
-        else:
-            # DDB Calculation
-            amortization_this_month = (current_book_value * depreciation_rate).quantize(Decimal("0.01"))
-            
-            # Switch to Straight Line check? 
-            # Standard DDB often switches to SL when SL > DDB to ensure full depreciation.
-            # Using remaining life and remaining depreciable base.
-            remaining_life = num_months - i + 1
-            if remaining_life > 0:
-                remaining_depreciable = current_book_value - salvage_value
-                sl_amortization = (remaining_depreciable / Decimal(remaining_life)).quantize(Decimal("0.01"))
-                amortization_this_month = max(amortization_this_month, sl_amortization)
-
-            # Cap so we don't go below salvage
-            if current_book_value - amortization_this_month < salvage_value:
-                amortization_this_month = current_book_value - salvage_value
-
-        accumulated_amortization += amortization_this_month
-        book_value -= amortization_this_month
-
-        schedule_data.append(_create_schedule_row(
-            i, current_date, 'Amortization', amortization_this_month, accumulated_amortization, book_value
-        ))
-
-    return schedule_data
-
-def _calculate_soyd_schedule(total_cost: Decimal, salvage_value: Decimal, start_date: datetime, num_months: int):
+    # Imported on first use so app startup doesn't wait for Numba
+    from logic_kernels import ddb_kernel
+
+    expense = np.empty(num_months + 1, dtype=np.int64)
+    accumulated = np.empty(num_months + 1, dtype=np.int64)
+    book_value = np.empty(num_months + 1, dtype=np.int64)
+    ddb_kernel(total_cents, salvage_cents, num_months, expense, accumulated, book_value)
+    return _schedule_columns(start_date, num_months, expense, accumulated, book_value)
+
+@lru_cache(maxsize=32)
+def _soyd_weights(num_months: int):
+    """Returns the remaining-life weights n, n-1, ..., 1 and their sum, built once per schedule length."""
+    remaining_life = np.arange(num_months, 0, -1, dtype=np.int64)
+    remaining_life.flags.writeable = False  # Shared between calls through the cache
+    return remaining_life, num_months * (num_months + 1) // 2
+
+def _calculate_soyd_schedule(total_cents: int, salvage_cents: int, start_date: datetime, num_months: int):
     """Calculates the amortization schedule using the Sum-of-the-Years' Digits (SOYD) method."""
-    if num_months == 0:
-        return []
-
-    soyd = Decimal(num_months * (num_months + 1)) / Decimal(2)
-    depreciable_base = total_cost - salvage_value
-
-    schedule_data = []
-    accumulated_amortization = Decimal("0.00")
-    book_value = total_cost
-
-    # Initial row
-    schedule_data.append(_create_schedule_row(
-        0, start_date, 'Initial Value', Decimal("0.00"), Decimal("0.00"), book_value
-    ))
-
-    for i in range(1, num_months + 1):
-        target_date = start_date + relativedelta(months=i-1)
-        _, days_in_month = monthrange(target_date.year, target_date.month)
-        day = min(start_date.day, days_in_month)
-        current_date = target_date.replace(day=day)
-
-        if book_value <= salvage_value:
-             amortization_this_month = Decimal("0.00")
-        else:
-            remaining_life = Decimal(num_months - i + 1)
-            amortization_this_month = (depreciable_base * (remaining_life / soyd)).quantize(Decimal("0.01"))
-
-            # Handing rounding on the last month or if exceeding salvage
-            if book_value - amortization_this_month < salvage_value:
-                amortization_this_month = book_value - salvage_value
-
-        accumulated_amortization += amortization_this_month
-        book_value -= amortization_this_month
-
-        schedule_data.append(_create_schedule_row(
-            i, current_date, 'Amortization', amortization_this_month, accumulated_amortization, book_value
-        ))
-
-    return schedule_data
+    remaining_life, soyd = _soyd_weights(num_months)
+    monthly = _div_round((total_cents - salvage_cents) * remaining_life, soyd)
+    return _closed_form_schedule(total_cents, salvage_cents, start_date, monthly)
 
 def calculate_amortization_schedule(total_cost: Decimal, salvage_value: Decimal, start_date: datetime, end_date: datetime, method: str):
-    """Calculates the amortization schedule based on the selected method."""
+    """
+    Calculates the amortization schedule based on the selected method.
+    Results are cached on the inputs; callers get a shallow copy so they can't replace the cached columns.
+    """
+    schedule_df, error_msg = _calculate_cached(_to_cents(total_cost), _to_cents(salvage_value), start_date, end_date, method)
+    if error_msg:
+        return None, error_msg
+    return schedule_df.copy(deep=False), None
+
+@lru_cache(maxsize=64)
+def _calculate_cached(total_cents: int, salvage_cents: int, start_date: datetime, end_date: datetime, method: str):
+    """Builds the schedule for hashable inputs (money in whole cents)."""
     num_months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month) + 1
     
     if num_months <= 0:
         return None, "Invalid lease period. The end date must be after the start date."
         
-    if salvage_value >= total_cost:
+    if salvage_cents >= total_cents:
          return None, "Salvage value cannot be greater than or equal to the total cost."
 
     if method == 'Straight-Line':
-        schedule_data = _calculate_straight_line_schedule(total_cost, salvage_value, start_date, num_months)
+        schedule_data = _calculate_straight_line_schedule(total_cents, salvage_cents, start_date, num_months)
     elif method == 'Double Declining Balance':
-        schedule_data = _calculate_declining_balance_schedule(total_cost, salvage_value, start_date, num_months)
+        schedule_data = _calculate_declining_balance_schedule(total_cents, salvage_cents, start_date, num_months)
     elif method == "Sum-of-the-Years Digits":
-        schedule_data = _calculate_soyd_schedule(total_cost, salvage_value, start_date, num_months)
+        schedule_data = _calculate_soyd_schedule(total_cents, salvage_cents, start_date, num_months)
     else:
         return None, f"Unknown amortization method: {method}"
 
-    columns = [
-        'Period', 'Date', 'Description', 'Amortization Expense',
-        'Accumulated Amortization', 'Book Value'
-    ]
-    
-    schedule_df = pd.DataFrame(schedule_data, columns=columns)
+    # The builders return whole columns, so pandas doesn't have to infer and transpose rows
+    schedule_df = pd.DataFrame(schedule_data)
     
     return schedule_df, None
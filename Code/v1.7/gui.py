@@ -1,11 +1,15 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from itertools import islice
 import locale
 import os
+import threading
 
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
@@ -15,7 +19,6 @@ from tkcalendar import DateEntry
 
 # --- Constants ---
 DATE_FORMAT = "%Y-%m-%d"
-SUPPORTED_DATE_FORMATS = [DATE_FORMAT, "%Y%m%d"]
 
 METHOD_STRAIGHT_LINE = 'Straight-Line'
 METHOD_DECLINING_BALANCE = 'Double Declining Balance'
@@ -24,21 +27,83 @@ AMORTIZATION_METHODS = [METHOD_STRAIGHT_LINE, METHOD_DECLINING_BALANCE, METHOD_S
 
 COLUMNS = ('Period', 'Date', 'Description', 'Expense', 'Accumulated', 'Book Value')
 NUMERIC_COLUMNS = ['Amortization Expense', 'Accumulated Amortization', 'Book Value']
+ANCHORS = {'Date': tk.W, 'Description': tk.W} # Text columns; the rest are right-aligned numbers
+TREE_CHUNK_SIZE = 100 # Rows inserted into the table per event-loop pass
+CHART_DOWNSAMPLE_THRESHOLD = 400 # Schedules longer than this are thinned out before plotting
+CHART_TARGET_POINTS = 200
+MIN_CACHED_SCHEDULE_DAYS = 60 # Shorter schedules are cheaper to recompute than to cache
+
+# Separator handling for '1,000.50' (drop the commas) and '1.000,50' (drop the dots, comma becomes the point)
+_DOT_DECIMAL = str.maketrans('', '', ',')
+_COMMA_DECIMAL = str.maketrans({'.': None, ',': '.'})
 
 # --- Utility Functions ---
 
 def parse_flexible_date(date_string: str) -> datetime:
-    """Parses a date string from one of the supported formats."""
-    date_string = date_string.strip()    
-    formats_to_try = SUPPORTED_DATE_FORMATS
-    for fmt in formats_to_try:
+    """Parses a date string in 'YYYY-MM-DD' or 'YYYYMMDD' format."""
+    s = date_string.strip()
+    if len(s) == 10 and s[4] == '-' and s[7] == '-':
+        digits = s[:4] + s[5:7] + s[8:]
+    elif len(s) == 8:
+        digits = s
+    else:
+        digits = ''
+
+    # Slice the fields directly instead of trying strptime once per format
+    if digits.isascii() and digits.isdigit():
         try:
-            return datetime.strptime(date_string, fmt)
+            return datetime(int(digits[:4]), int(digits[4:6]), int(digits[6:]))
         except ValueError:
-            continue
+            pass  # Out-of-range month or day
     raise ValueError("Invalid date format. Use 'YYYY-MM-DD' or 'YYYYMMDD'.")
 
+_format_currency_plain = '{:,.2f}'.format
+
+def _money_floats(column: pd.Series) -> list:
+    """Converts a Decimal money column to plain floats in one NumPy pass."""
+    return column.to_numpy(dtype=np.float64).tolist()
+
+def _format_column_plain(column: pd.Series):
+    """Formats a money column as '1,234.50' strings without going through the locale module.
+    The strings come from a C-level str.format and are produced as the iterator is consumed.
+    """
+    return map(_format_currency_plain, _money_floats(column))
+
+def _make_locale_column_formatter():
+    """Builds a money column formatter for the current locale.
+    The separators are read from localeconv() once; each value is then formatted with the
+    plain '1,234.50' formatter and its ',' and '.' swapped for them in a single translate.
+    """
+    conv = locale.localeconv()
+    separators = str.maketrans({',': conv['thousands_sep'], '.': conv['decimal_point']})
+
+    def format_currency(val) -> str:
+        return _format_currency_plain(val).translate(separators)
+
+    def format_column(column: pd.Series):
+        return map(format_currency, _money_floats(column))
+
+    return format_column
+
+@lru_cache(maxsize=32)
+def _cached_amortization_schedule(total_cost: Decimal, salvage_value: Decimal, start_date: datetime, end_date: datetime, method: str):
+    return calculate_amortization_schedule(total_cost, salvage_value, start_date, end_date, method)
+
+def get_amortization_schedule(total_cost: Decimal, salvage_value: Decimal, start_date: datetime, end_date: datetime, method: str):
+    """Returns (schedule_df, error_msg), reusing the result of an earlier identical request.
+    Callers get a shallow copy, so changing the returned frame can't alter the cached one.
+    """
+    if (end_date - start_date).days < MIN_CACHED_SCHEDULE_DAYS:
+        return calculate_amortization_schedule(total_cost, salvage_value, start_date, end_date, method)
+    schedule_df, error_msg = _cached_amortization_schedule(total_cost, salvage_value, start_date, end_date, method)
+    if error_msg:
+        return None, error_msg
+    return schedule_df.copy(deep=False), None
+
 class AmortizationApp(tk.Tk):
+    # Path of the optional azure.tcl theme, looked up once per process ('' when it is missing)
+    _theme_path: str | None = None
+
     def __init__(self) -> None:
         super().__init__()
         self.title("AmorPy - Amortization & Depreciation Calculator")
@@ -67,9 +132,19 @@ class AmortizationApp(tk.Tk):
         self.total_cost_var = tk.StringVar()
         self.salvage_value_var = tk.StringVar(value="0")
         self.method_var = tk.StringVar(value=METHOD_STRAIGHT_LINE)
-        self.start_date_var = tk.StringVar(value=datetime.now().strftime('%Y-%m-01'))
-        self.end_date_var = tk.StringVar(value=(datetime.now() + relativedelta(years=1, days=-1)).strftime(DATE_FORMAT))
+        now = datetime.now()
+        self.start_date_var = tk.StringVar(value=now.strftime('%Y-%m-01'))
+        self.end_date_var = tk.StringVar(value=(now + relativedelta(years=1, days=-1)).strftime(DATE_FORMAT))
         self.schedule_df: pd.DataFrame | None = None
+        self._last_inputs: tuple | None = None # Inputs behind the schedule currently shown
+        self._pending_inputs: tuple | None = None
+        self._calc_generation = 0 # Bumped by Reset Form so a late worker result is dropped
+        self._calculating = False # A calculation worker is running
+        self._saving = False # A save worker is running
+        self._pending_rows = iter(()) # Formatted rows not yet inserted into the table
+        self._row_count = 0
+        self._loaded_rows = 0
+        self._load_job = None # Pending after_idle job while the table is being filled
 
         self._create_input_widgets(input_frame)
         self._create_action_buttons(main_frame)
@@ -86,7 +161,12 @@ class AmortizationApp(tk.Tk):
         # Tab 2: Chart (Graph)
         self.tab_chart = ttk.Frame(self.notebook, padding=5)
         self.notebook.add(self.tab_chart, text="Chart")
-        self.chart_canvas = None
+        self.chart_canvas = None # Built on the first plot, then reused
+        self.ax = None
+        self.line_bv = None
+        self.line_acc = None
+        self._chart_dirty = False # The chart lags behind schedule_df until its tab is shown
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
 
         # --- Status Bar ---
         self.status_var = tk.StringVar()
@@ -95,11 +175,15 @@ class AmortizationApp(tk.Tk):
 
     def _setup_styles(self) -> None:
         style = ttk.Style(self)
-        try:
-            self.tk.call("source", "azure.tcl") # Optional: Try to load a theme if available, otherwise default
-            self.tk.call("set_theme", "light") 
-        except:
-            pass
+        if AmortizationApp._theme_path is None:
+            theme_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "azure.tcl")
+            AmortizationApp._theme_path = theme_path if os.path.exists(theme_path) else ''
+        if AmortizationApp._theme_path:
+            try:
+                self.tk.call("source", AmortizationApp._theme_path) # Optional: load the theme if available, otherwise default
+                self.tk.call("set_theme", "light") 
+            except tk.TclError:
+                pass
             
         style.configure("Status.TLabel", background="#f0f0f0", foreground="#333333")
         style.configure("Accent.TButton", font=('Helvetica', 9, 'bold'))
@@ -129,19 +213,24 @@ class AmortizationApp(tk.Tk):
         self.asset_name_var.set("New Asset")
         self.total_cost_var.set("")
         self.salvage_value_var.set("0")
-        self.start_date_var.set(datetime.now().strftime('%Y-%m-01'))
-        self.end_date_var.set((datetime.now() + relativedelta(years=1, days=-1)).strftime(DATE_FORMAT))
+        # Read the clock once so the defaults can't straddle midnight (or a month end)
+        now = datetime.now()
+        first = now.replace(day=1)
+        end = now + relativedelta(years=1, days=-1)
+        self.start_date_var.set(first.strftime(DATE_FORMAT))
+        self.end_date_var.set(end.strftime(DATE_FORMAT))
         
         if hasattr(self, 'start_date_entry'):
-            self.start_date_entry.set_date(datetime.now().replace(day=1))
+            self.start_date_entry.set_date(first)
         if hasattr(self, 'end_date_entry'):
-            self.end_date_entry.set_date(datetime.now() + relativedelta(years=1, days=-1))
+            self.end_date_entry.set_date(end)
         
         self.schedule_df = None
-        self.tree.delete(*self.tree.get_children())
-        if self.chart_canvas:
-            self.chart_canvas.get_tk_widget().destroy()
-            self.chart_canvas = None
+        self._last_inputs = None
+        self._calc_generation += 1
+        self._reset_tree()
+        self._chart_dirty = False
+        self._clear_chart()
             
         self.status_var.set("Form cleared.")
         self.save_button.config(state='disabled')
@@ -149,9 +238,9 @@ class AmortizationApp(tk.Tk):
     def setup_locale(self) -> None:
         try:
             locale.setlocale(locale.LC_ALL, 'id_ID')
-            self.format_currency = lambda val: locale.format_string('%.2f', val, grouping=True)
+            self._format_currency_column = _make_locale_column_formatter()
         except locale.Error:
-            self.format_currency = lambda val: f"{val:,.2f}"
+            self._format_currency_column = _format_column_plain
 
     def _create_input_widgets(self, parent_frame: ttk.Frame) -> None:
         parent_frame.columnconfigure(1, weight=1)
@@ -198,7 +287,8 @@ class AmortizationApp(tk.Tk):
         button_frame = ttk.Frame(parent_frame)
         button_frame.pack(fill=tk.X, pady=(0, 10))
 
-        ttk.Button(button_frame, text="Calculate & Plot", command=self._perform_calculation, style="Accent.TButton").pack(side=tk.LEFT)
+        self.calculate_button = ttk.Button(button_frame, text="Calculate & Plot", command=self._perform_calculation, style="Accent.TButton")
+        self.calculate_button.pack(side=tk.LEFT)
         self.save_button = ttk.Button(button_frame, text="Save to Excel", command=self._save_to_excel, state='disabled')
         self.save_button.pack(side=tk.LEFT, padx=10)
 
@@ -206,19 +296,18 @@ class AmortizationApp(tk.Tk):
         self.tree = ttk.Treeview(parent_frame, show='headings')
         self.tree["columns"] = COLUMNS
         
-        for col in self.tree["columns"]:
+        for col in COLUMNS:
             self.tree.heading(col, text=col, anchor=tk.W)
-            anchor = tk.E if col not in ['Description', 'Date'] else tk.W
-            self.tree.column(col, anchor=anchor, width=90)
+            self.tree.column(col, anchor=ANCHORS.get(col, tk.E), width=90)
 
-        v_scroll = ttk.Scrollbar(parent_frame, orient="vertical", command=self.tree.yview)
+        self.v_scroll = ttk.Scrollbar(parent_frame, orient="vertical", command=self.tree.yview)
         h_scroll = ttk.Scrollbar(parent_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scroll.set, xscrollcommand=h_scroll.set)
+        self.tree.configure(yscrollcommand=self.v_scroll.set, xscrollcommand=h_scroll.set)
 
         parent_frame.grid_rowconfigure(0, weight=1)
         parent_frame.grid_columnconfigure(0, weight=1)
         self.tree.grid(row=0, column=0, sticky='nsew')
-        v_scroll.grid(row=0, column=1, sticky='ns')
+        self.v_scroll.grid(row=0, column=1, sticky='ns')
         h_scroll.grid(row=1, column=0, sticky='ew')
 
     def _parse_currency(self, val: str) -> Decimal:
@@ -232,9 +321,9 @@ class AmortizationApp(tk.Tk):
         last_comma = val.rfind(',')
         # Determine which is the decimal separator
         if last_dot > last_comma: # Format: 1,000.50
-            clean = val.replace(',', '')
+            clean = val.translate(_DOT_DECIMAL)
         elif last_comma > last_dot: # Format: 1.000,50
-            clean = val.replace('.', '').replace(',', '.')
+            clean = val.translate(_COMMA_DECIMAL)
         else: # Format: 1000.50 or 1000
             clean = val
         if not clean:
@@ -254,8 +343,10 @@ class AmortizationApp(tk.Tk):
             if salvage_value < 0:
                 raise ValueError("Salvage Value cannot be negative.")
 
-            start_date = parse_flexible_date(self.start_date_var.get())
-            end_date = parse_flexible_date(self.end_date_var.get())
+            # The calendar widgets already hold a date object, so there is no need
+            # to format it into the StringVar and parse it back out again
+            start_date = datetime.combine(self.start_date_entry.get_date(), datetime.min.time())
+            end_date = datetime.combine(self.end_date_entry.get_date(), datetime.min.time())
             method = self.method_var.get()
             
             if end_date <= start_date:
@@ -271,76 +362,211 @@ class AmortizationApp(tk.Tk):
             return None
 
     def _perform_calculation(self) -> None:
-        self.schedule_df = None
-        self.tree.delete(*self.tree.get_children())
-        if self.chart_canvas:
-            self.chart_canvas.get_tk_widget().destroy()
-            self.chart_canvas = None
-
+        # Invalid input leaves the current table and chart on screen
         inputs = self._validate_and_get_inputs()
         if not inputs:
             return
+
+        # Nothing changed since the last successful run: keep the table and chart as they are
+        if inputs == self._last_inputs and self.schedule_df is not None:
+            self.status_var.set("Schedule is already up to date.")
+            return
         
-        total_cost, salvage_value, start_date, end_date, method = inputs
-        
-        df, error_msg = calculate_amortization_schedule(total_cost, salvage_value, start_date, end_date, method)
+        # Compute on a worker thread so the window keeps responding;
+        # the button stays disabled until the result is back on the Tk thread.
+        self._calculating = True
+        self.calculate_button.config(state='disabled')
+        self.save_button.config(state='disabled')
+        self.status_var.set("Calculating...")
+        self._pending_inputs = inputs
+        threading.Thread(target=self._calc_worker, args=(self._calc_generation, *inputs), daemon=True).start()
+
+    def _calc_worker(self, generation: int, total_cost: Decimal, salvage_value: Decimal, start_date: datetime, end_date: datetime, method: str) -> None:
+        """Runs on the worker thread; only hands the result back via after()."""
+        try:
+            df, error_msg = get_amortization_schedule(total_cost, salvage_value, start_date, end_date, method)
+        except Exception as e:
+            df, error_msg = None, str(e)
+        self.after(0, self._calc_done, generation, df, error_msg)
+
+    def _calc_done(self, generation: int, df: pd.DataFrame | None, error_msg: str | None) -> None:
+        """Runs on the Tk thread once the worker has finished."""
+        self._calculating = False
+        self.calculate_button.config(state='normal')
+
+        # The form was reset while this worker ran; its result no longer applies
+        if generation != self._calc_generation:
+            return
 
         if error_msg:
+            self.status_var.set("")
+            # The previous schedule is still shown, so it can still be saved
+            self._update_save_button()
             messagebox.showerror("Calculation Error", error_msg)
             return
 
+        # Replace the previous results only now that there is a new schedule;
+        # the chart lines are swapped in place by _plot_chart.
         self.schedule_df = df
+        self._last_inputs = self._pending_inputs
+        self._reset_tree()
         
-        # Populate Table
-        for _, row in self.schedule_df.iterrows():
-            formatted_values = [
-                row['Period'],
-                row['Date'].strftime(DATE_FORMAT),
-                row['Description'],
-                self.format_currency(row['Amortization Expense']),
-                self.format_currency(row['Accumulated Amortization']),
-                self.format_currency(row['Book Value'])
-            ]
-            self.tree.insert("", "end", values=formatted_values)
-
-        # Plot Chart
-        self._plot_chart(df)
+        self._populate_treeview(df)
+
+        # Plot Chart: right away if its tab is showing, otherwise once it is opened
+        self._chart_dirty = True
+        self._on_tab_changed()
 
         self.status_var.set("Calculation successful.")
-        self.save_button.config(state='normal')
+        self._update_save_button()
         
-    def _plot_chart(self, df: pd.DataFrame) -> None:
+    def _populate_treeview(self, df: pd.DataFrame) -> None:
+        """Shows the first rows of the schedule right away; the rest follow in idle-time chunks."""
+        # Date and cell values are extracted column-wise up front; the money columns are
+        # only formatted as their rows are pulled from the iterator. Every cell is already
+        # a str, so Tk takes the tuples as they are without converting each object.
+        format_column = self._format_currency_column
+        self._pending_rows = zip(
+            map(str, df['Period'].tolist()),
+            df['Date'].dt.strftime(DATE_FORMAT).tolist(),
+            df['Description'].tolist(),
+            format_column(df['Amortization Expense']),
+            format_column(df['Accumulated Amortization']),
+            format_column(df['Book Value'])
+        )
+        self._row_count = len(df)
+        # Unhook the scrollbar while filling so the visible range isn't recomputed
+        # for every chunk; it is reattached once the last chunk is in.
+        self.tree.configure(yscrollcommand='')
+        # Show the first rows right away; the rest follow in idle time after the first paint,
+        # so the scrollbar and keyboard navigation end up covering the whole schedule
+        self._load_more_rows()
+
+    def _load_more_rows(self) -> None:
+        """Appends the next TREE_CHUNK_SIZE rows and schedules another pass if rows remain."""
+        insert = self.tree.insert
+        for formatted_values in islice(self._pending_rows, TREE_CHUNK_SIZE):
+            # The period number is unique within a schedule, so it doubles as the item id
+            insert("", "end", iid=formatted_values[0], values=formatted_values)
+            self._loaded_rows += 1
+
+        if self._loaded_rows < self._row_count:
+            self._load_job = self.after_idle(self._load_more_rows)
+        else:
+            self._load_job = None
+            self._reattach_scrollbar()
+
+    def _reset_tree(self) -> None:
+        """Empties the table and stops a fill that is still in progress."""
+        if self._load_job is not None:
+            self.after_cancel(self._load_job)
+            self._load_job = None
+            self._reattach_scrollbar()
+        self._pending_rows = iter(())
+        self._row_count = 0
+        self._loaded_rows = 0
+        self.tree.delete(*self.tree.get_children())
+
+    def _reattach_scrollbar(self) -> None:
+        self.tree.configure(yscrollcommand=self.v_scroll.set)
+        self.v_scroll.set(*self.tree.yview())
+
+    def _on_tab_changed(self, event=None) -> None:
+        """Draws a pending chart update once the Chart tab is the one on screen."""
+        if self._chart_dirty and self.notebook.select() == str(self.tab_chart):
+            self._chart_dirty = False
+            self._plot_chart(self.schedule_df)
+
+    def _create_chart(self) -> None:
+        """Builds the figure, its two lines and the Tk canvas once; later plots only swap the line data."""
         fig = Figure(figsize=(5, 4), dpi=100)
         ax = fig.add_subplot(111)
+        # The lines start out empty, so tell the x axis up front that it holds dates
+        ax.xaxis_date()
         
-        dates = df['Date']
-        book_value = df['Book Value']
-        accumulated = df['Accumulated Amortization']
-        
-        ax.plot(dates, book_value, label='Book Value', color='#2196F3', linewidth=2)
-        ax.plot(dates, accumulated, label='Accumulated Amortization', color='#F44336', linewidth=2)
+        self.line_bv, = ax.plot([], [], label='Book Value', color='#2196F3', linewidth=2)
+        self.line_acc, = ax.plot([], [], label='Accumulated Amortization', color='#F44336', linewidth=2)
         
         ax.set_title('Amortization Schedule')
         ax.set_xlabel('Date')
         ax.set_ylabel('Currency')
         ax.legend()
         ax.grid(True, linestyle='--', alpha=0.7)
+        self.ax = ax
         
         # Embed in Tkinter
         self.chart_canvas = FigureCanvasTkAgg(fig, master=self.tab_chart)
-        self.chart_canvas.draw()
         self.chart_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
+    def _clear_chart(self) -> None:
+        if self.chart_canvas:
+            self.line_bv.set_data([], [])
+            self.line_acc.set_data([], [])
+            self.chart_canvas.draw_idle()
+
+    def _plot_chart(self, df: pd.DataFrame) -> None:
+        if self.chart_canvas is None:
+            self._create_chart()
+
+        # Both curves are monotonic, so every n-th row plus the final one draws the same
+        # picture with far fewer points. self.schedule_df itself is left untouched.
+        if len(df) > CHART_DOWNSAMPLE_THRESHOLD:
+            step = len(df) // CHART_TARGET_POINTS
+            df = df.iloc[list(range(0, len(df) - 1, step)) + [len(df) - 1]]
+        
+        # Hand Matplotlib plain arrays: datetime64 dates and the Decimal columns as float64,
+        # so the lines don't go through pandas/object conversion on every redraw
+        dates = df['Date'].to_numpy()
+        book_value = df['Book Value'].to_numpy(dtype=np.float64)
+        accumulated = df['Accumulated Amortization'].to_numpy(dtype=np.float64)
+        
+        self.line_bv.set_data(dates, book_value)
+        self.line_acc.set_data(dates, accumulated)
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.chart_canvas.draw_idle()
+
+    def _update_save_button(self) -> None:
+        """Enables Save only when there is a schedule and no calculation or save is running."""
+        can_save = self.schedule_df is not None and not (self._calculating or self._saving)
+        self.save_button.config(state='normal' if can_save else 'disabled')
+
     def _save_to_excel(self) -> None:
-        if self.schedule_df is None:
+        # The File menu entry stays active, so the flags are checked here as well as on the button
+        if self.schedule_df is None or self._calculating or self._saving:
             return
             
+        asset_name = self.asset_name_var.get()
+        # Sanitize filename to remove invalid characters
+        safe_asset_name = "".join(c for c in asset_name if c.isalnum() or c in (' ', '_')).rstrip()
+        filename = f"Schedule_{safe_asset_name.replace(' ', '_')}.xlsx"
+
+        # Write the workbook on a worker thread, like the calculation itself
+        self._saving = True
+        self.save_button.config(state='disabled')
+        self.status_var.set(f"Saving {filename}...")
+        threading.Thread(target=self._save_worker, args=(self.schedule_df, filename), daemon=True).start()
+
+    def _save_worker(self, df: pd.DataFrame, filename: str) -> None:
+        """Runs on the worker thread; only hands the outcome back via after()."""
         try:
-            asset_name = self.asset_name_var.get()
-            # Sanitize filename to remove invalid characters
-            safe_asset_name = "".join(c for c in asset_name if c.isalnum() or c in (' ', '_')).rstrip()
-            filename = f"Schedule_{safe_asset_name.replace(' ', '_')}.xlsx"
-            self.schedule_df.to_excel(filename, index=False)
-            messagebox.showinfo("Success", f"Saved to {filename}")
+            with pd.ExcelWriter(filename, engine='xlsxwriter') as writer:
+                df.to_excel(writer, sheet_name='Schedule', index=False)
+                # One number format on the money columns (D:F) instead of styling each cell
+                money_fmt = writer.book.add_format({'num_format': '#,##0.00'})
+                writer.sheets['Schedule'].set_column('D:F', 18, money_fmt)
+            error_msg = None
         except Exception as e:
-            messagebox.showerror("Error", str(e))
+            error_msg = str(e)
+        self.after(0, self._save_done, filename, error_msg)
+
+    def _save_done(self, filename: str, error_msg: str | None) -> None:
+        """Runs on the Tk thread once the workbook has been written."""
+        self._saving = False
+        self._update_save_button()
+        if error_msg:
+            self.status_var.set("")
+            messagebox.showerror("Error", error_msg)
+        else:
+            self.status_var.set(f"Saved to {filename}")
+            messagebox.showinfo("Success", f"Saved to {filename}")